@@ -50,8 +50,15 @@ class CapabilityAuditor:
         self.capabilities: Dict[str, Capability] = {}
         self.gaps: List[Gap] = []
     
-    def scan_modules(self) -> Dict[str, Capability]:
-        """Scan all Python modules and extract capabilities"""
+    def scan_modules(self, scan_cache: Optional[Dict[Path, tuple]] = None) -> Dict[str, Capability]:
+        """
+        Scan all Python modules and extract capabilities
+        
+        Args:
+            scan_cache: Optional {path: (st_mtime_ns, Capability or None)} dict
+                owned by the caller; files whose mtime is unchanged since the
+                previous scan reuse their cached analysis
+        """
         logger.info("Scanning Saraphina modules...")
         
         py_files = list(self.saraphina_root.glob("*.py"))
@@ -61,12 +68,26 @@ class CapabilityAuditor:
                 continue
             
             try:
-                cap = self._analyze_module(py_file)
+                if scan_cache is not None:
+                    mtime_ns = py_file.stat().st_mtime_ns
+                    cached = scan_cache.get(py_file)
+                    if cached is not None and cached[0] == mtime_ns:
+                        cap = cached[1]
+                    else:
+                        cap = self._analyze_module(py_file)
+                        scan_cache[py_file] = (mtime_ns, cap)
+                else:
+                    cap = self._analyze_module(py_file)
                 if cap:
                     self.capabilities[cap.name] = cap
             except Exception as e:
                 logger.debug(f"Failed to analyze {py_file.name}: {e}")
         
+        if scan_cache is not None:
+            # Forget files that no longer exist
+            for stale in set(scan_cache).difference(py_files):
+                del scan_cache[stale]
+        
         logger.info(f"Found {len(self.capabilities)} capabilities")
         return self.capabilities
     
@@ -73,7 +73,9 @@ class CodeAuditTrail:
         approval_phrase: Optional[str] = None,
         success: bool = False,
         error_message: Optional[str] = None,
-        details: Optional[Dict[str, Any]] = None
+        details: Optional[Dict[str, Any]] = None,
+        original_hash: Optional[str] = None,
+        modified_hash: Optional[str] = None
     ) -> int:
         """
         Log a code modification attempt (immutable).
@@ -90,21 +92,22 @@ class CodeAuditTrail:
             success: Whether modification succeeded
             error_message: Error if failed
             details: Additional context
+            original_hash: Precomputed sha256 of original_code (skips rehashing)
+            modified_hash: Precomputed sha256 of modified_code (skips rehashing)
         
         Returns:
             Audit log entry ID
         """
         timestamp = datetime.now().isoformat()
         
-        # Hash codes for integrity
-        original_hash = None
-        if original_code:
+        # Hash codes for integrity (unless the caller already has the digests)
+        if original_hash is None and original_code:
             original_hash = hashlib.sha256(original_code.encode('utf-8')).hexdigest()
         
-        modified_hash = None
         patch_size = None
         if modified_code:
-            modified_hash = hashlib.sha256(modified_code.encode('utf-8')).hexdigest()
+            if modified_hash is None:
+                modified_hash = hashlib.sha256(modified_code.encode('utf-8')).hexdigest()
             patch_size = len(modified_code) - len(original_code or '')
         
         # Extract risk info
@@ -38,10 +38,17 @@ class CodeProposalDB:
                 related_concepts TEXT,
                 status TEXT DEFAULT 'pending',
                 created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
+                updated_at TEXT NOT NULL,
+                metadata TEXT
             )
         """)
         
+        # Databases created before the metadata column existed
+        try:
+            cursor.execute("ALTER TABLE code_proposals ADD COLUMN metadata TEXT")
+        except sqlite3.OperationalError:
+            pass
+        
         # Test execution results table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS test_executions (
@@ -108,6 +115,7 @@ class CodeProposalDB:
         
         Args:
             proposal_data: Dict with proposal_id, feature_spec, code, tests, etc.
+                and an optional metadata dict (kept in its own column)
         
         Returns:
             True if stored successfully
@@ -116,13 +124,15 @@ class CodeProposalDB:
             cursor = self.conn.cursor()
             
             related_concepts_json = json.dumps(proposal_data.get('related_concepts', []))
+            metadata = proposal_data.get('metadata')
+            metadata_json = json.dumps(metadata) if metadata is not None else None
             now = datetime.now().isoformat()
             
             cursor.execute("""
                 INSERT OR REPLACE INTO code_proposals
                 (id, feature_spec, language, code, tests, explanation, 
-                 related_concepts, status, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 related_concepts, status, created_at, updated_at, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 proposal_data['proposal_id'],
                 proposal_data['feature_spec'],
@@ -133,7 +143,8 @@ class CodeProposalDB:
                 related_concepts_json,
                 'pending',
                 now,
-                now
+                now,
+                metadata_json
             ))
             
             self.conn.commit()
@@ -221,7 +232,8 @@ class CodeProposalDB:
                 'related_concepts': json.loads(row['related_concepts'] or '[]'),
                 'status': row['status'],
                 'created_at': row['created_at'],
-                'updated_at': row['updated_at']
+                'updated_at': row['updated_at'],
+                'metadata': json.loads(row['metadata']) if row['metadata'] else None
             }
         return None
     
@@ -13,15 +13,34 @@ from __future__ import annotations
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 import difflib
 import re
 import logging
+import os
 import shutil
 
 logger = logging.getLogger(__name__)
 
+# Below this many patches create_patches_bulk diffs in-process; pool start-up
+# would cost more than it saves
+BULK_DIFF_MIN_ITEMS = 32
 
-@dataclass
+
+def _unified_diff(file_path: str, old_content: str, new_content: str) -> str:
+    """Unified diff between two versions of a file (module level so it pickles)"""
+    name = Path(file_path).name
+    diff = difflib.unified_diff(
+        old_content.splitlines(keepends=True),
+        new_content.splitlines(keepends=True),
+        fromfile=f"a/{name}",
+        tofile=f"b/{name}",
+        lineterm=''
+    )
+    return '\n'.join(diff)
+
+
+@dataclass(slots=True)
 class UpgradePatch:
     """Represents a patch to apply to a file"""
     file_path: str
@@ -90,24 +109,60 @@ class CodeUpgrader:
         Returns:
             UpgradePatch object
         """
-        # Generate unified diff
-        diff = difflib.unified_diff(
-            old_content.splitlines(keepends=True),
-            new_content.splitlines(keepends=True),
-            fromfile=f"a/{Path(file_path).name}",
-            tofile=f"b/{Path(file_path).name}",
-            lineterm=''
-        )
-        unified_diff = '\n'.join(diff)
-        
         return UpgradePatch(
             file_path=file_path,
             old_content=old_content,
             new_content=new_content,
-            unified_diff=unified_diff,
+            unified_diff=_unified_diff(file_path, old_content, new_content),
             description=description
         )
     
+    def create_patches_bulk(
+        self,
+        items: List[Tuple[str, str, str, str]]
+    ) -> List[UpgradePatch]:
+        """
+        Create many patches at once, generating the diffs in parallel.
+        
+        difflib is pure Python and CPU-bound, so large batches are spread
+        over a process pool; small batches (or a pool that cannot start)
+        fall back to in-process generation.
+        
+        Args:
+            items: List of (file_path, old_content, new_content, description)
+        
+        Returns:
+            List of UpgradePatch objects in the same order as items
+        """
+        if not items:
+            return []
+        
+        paths, olds, news, descriptions = zip(*items)
+        diffs = None
+        if len(items) >= BULK_DIFF_MIN_ITEMS:
+            workers = os.cpu_count() or 1
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as ex:
+                    diffs = list(ex.map(
+                        _unified_diff, paths, olds, news,
+                        chunksize=max(1, len(items) // (workers * 4))
+                    ))
+            except Exception as e:
+                logger.warning(f"Parallel diff generation failed, falling back: {e}")
+        if diffs is None:
+            diffs = list(map(_unified_diff, paths, olds, news))
+        
+        return [
+            UpgradePatch(
+                file_path=path,
+                old_content=old,
+                new_content=new,
+                unified_diff=diff,
+                description=description
+            )
+            for path, old, new, diff, description in zip(paths, olds, news, diffs, descriptions)
+        ]
+    
     def create_patch_from_modifications(
         self,
         file_path: str,
@@ -163,8 +218,14 @@ class CodeUpgrader:
             issues.append(f"File not found: {patch.file_path}")
             return False, issues
         
-        # Check that current content matches expected old content
         current_content = path.read_text(encoding='utf-8')
+        return self._validate_content(patch, current_content)
+    
+    def _validate_content(self, patch: UpgradePatch, current_content: str) -> Tuple[bool, List[str]]:
+        """Validate a patch against already-loaded file content"""
+        issues = []
+        
+        # Check that current content matches expected old content
         if current_content != patch.old_content:
             # Content has changed since patch was created
             similarity = difflib.SequenceMatcher(
@@ -267,6 +328,85 @@ class CodeUpgrader:
         
         return result
     
+    def validate_patches(self, patches: List[UpgradePatch]) -> List[Tuple[bool, List[str]]]:
+        """
+        Validate several patches, reading each target file once.
+        
+        Args:
+            patches: UpgradePatch objects to validate
+        
+        Returns:
+            (is_valid, list_of_issues) per patch, in order
+        """
+        contents: Dict[str, Optional[str]] = {}
+        outcomes = []
+        for patch in patches:
+            if patch.file_path not in contents:
+                try:
+                    contents[patch.file_path] = Path(patch.file_path).read_text(encoding='utf-8')
+                except FileNotFoundError:
+                    contents[patch.file_path] = None
+            current_content = contents[patch.file_path]
+            if current_content is None:
+                outcomes.append((False, [f"File not found: {patch.file_path}"]))
+            else:
+                outcomes.append(self._validate_content(patch, current_content))
+        return outcomes
+    
+    def write_patch(
+        self,
+        patch: UpgradePatch,
+        create_backup: bool = True
+    ) -> UpgradeResult:
+        """
+        Write an already validated patch.
+        
+        The new content goes through a temporary file + rename, so a failed
+        write never leaves a half-written target; the temporary file takes
+        the target's permission bits first.
+        
+        Args:
+            patch: UpgradePatch to apply
+            create_backup: Whether to create backup
+        
+        Returns:
+            UpgradeResult with outcome
+        """
+        result = UpgradeResult(
+            success=False,
+            file_path=patch.file_path
+        )
+        
+        path = Path(patch.file_path)
+        if create_backup and path.exists():
+            backup_path = path.with_suffix(path.suffix + '.pre_upgrade')
+            shutil.copy2(path, backup_path)
+            result.backup_path = str(backup_path)
+            logger.info(f"Created backup: {backup_path}")
+        
+        if self.dry_run:
+            logger.info(f"DRY RUN: Would write {len(patch.new_content)} bytes to {path}")
+            result.success = True
+            return result
+        
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            tmp_path.write_text(patch.new_content, encoding='utf-8')
+            if path.exists():
+                shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+            logger.info(f"Successfully applied patch to {path}")
+            result.success = True
+        except Exception as e:
+            result.errors.append(f"Failed to write file: {e}")
+            logger.error(f"Failed to apply patch: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+        
+        return result
+    
     def apply_patch_list(
         self,
         patches: List[UpgradePatch],
@@ -225,6 +225,14 @@ def initialize_schema(conn: sqlite3.Connection) -> None:
           active INTEGER
         );
 
+        -- Snapshot checksums, valid while a file's mtime and size match
+        CREATE TABLE IF NOT EXISTS shadow_checksum_cache (
+          path TEXT PRIMARY KEY,
+          mtime_ns INTEGER,
+          size INTEGER,
+          checksum TEXT
+        );
+
         -- Review queue for manual approvals
         CREATE TABLE IF NOT EXISTS review_queue (
           id TEXT PRIMARY KEY,
@@ -127,6 +127,9 @@ class SelfModificationAPI:
     NOTE: All mutating methods require auth_token and will raise AuthorizationError for invalid/insufficient tokens.
     """
 
+    # How many _log_modification calls between re-checks of the logger level
+    _DEBUG_RECHECK_EVERY = 64
+
     def __init__(self, sess, gui=None):
         self.sess = sess
         self.gui = gui
@@ -134,6 +137,10 @@ class SelfModificationAPI:
         self.root_path = REPO_ROOT
         self.saraphina_path = self.root_path / "saraphina"
         self.modification_log = []
+        # Cached DEBUG-level check for the best-effort sink failures in
+        # _log_modification; refreshed every _DEBUG_RECHECK_EVERY events.
+        self._debug_on = logger.isEnabledFor(logging.DEBUG)
+        self._debug_events = 0
 
     # ==================== AUTH HELPERS ====================
     def _require_modify_privilege(self, auth_token: str) -> Dict[str, Any]:
@@ -571,6 +578,10 @@ class SelfModificationAPI:
     # ==================== LOGGING ====================
     def _log_modification(self, mod_type: str, old_value: Any, new_value: Any):
         """Log a modification to memory, knowledge base, and internal log"""
+        self._debug_events += 1
+        if self._debug_events >= self._DEBUG_RECHECK_EVERY:
+            self._debug_events = 0
+            self._debug_on = logger.isEnabledFor(logging.DEBUG)
         try:
             entry = {
                 "timestamp": datetime.utcnow().isoformat(),
@@ -590,7 +601,8 @@ class SelfModificationAPI:
                         tags=['self-modification', mod_type]
                     )
                 except Exception as e:
-                    logger.debug(f"Failed to log to episodic memory: {e}")
+                    if self._debug_on:
+                        logger.debug("Failed to log to episodic memory: %s", e)
             # Store in knowledge base if available
             if hasattr(self.sess, 'ke') and self.sess.ke:
                 try:
@@ -608,7 +620,8 @@ class SelfModificationAPI:
                         # fallback: if ke expects different signature
                         pass
                 except Exception as e:
-                    logger.debug(f"Failed to log to knowledge base: {e}")
+                    if self._debug_on:
+                        logger.debug("Failed to log to knowledge base: %s", e)
             # Store in AI memory bank if available
             if hasattr(self.sess, 'ai') and self.sess.ai:
                 try:
@@ -623,6 +636,8 @@ class SelfModificationAPI:
                             'importance': 8
                         })
                 except Exception as e:
-                    logger.debug(f"Failed to log to AI memory bank: {e}")
+                    if self._debug_on:
+                        logger.debug("Failed to log to AI memory bank: %s", e)
         except Exception as e:
-            logger.debug(f"Failed to complete _log_modification: {e}")
\ No newline at end of file
+            if self._debug_on:
+                logger.debug("Failed to complete _log_modification: %s", e)
\ No newline at end of file
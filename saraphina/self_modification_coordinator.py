@@ -17,11 +17,315 @@ from __future__ import annotations
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import codecs
+import io
+import os
 import re
 import logging
+import mmap
+import sqlite3
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Keyword buckets. Matching keeps the substring semantics of the original
+# keyword lists ('rename' still hits 'name', 'fixing' hits 'fix'): every
+# keyword is a single word, so it occurs in the request iff it occurs inside
+# one of its \w+ tokens.
+_REPLACE_VERBS = frozenset({'remove', 'change', 'replace', 'rename', 'update'})
+_REPLACE_NOUNS = frozenset({'ultra', 'name', 'title', 'header', 'text'})
+_CREATE_VERBS = frozenset({'create', 'add', 'build', 'make', 'implement'})
+_CREATE_NOUNS = frozenset({'module', 'class', 'function', 'feature'})
+_FIX_VERBS = frozenset({'fix', 'repair', 'solve', 'debug'})
+_REFACTOR_VERBS = frozenset({'refactor', 'extract', 'cleanup', 'optimize'})
+_GUI_KEYWORDS = frozenset({'gui', 'window', 'interface', 'display', 'title', 'header', 'name'})
+
+# Intent rules, checked in order: every bucket in a rule must be hit
+_INTENT_RULES: Tuple[Tuple[str, Tuple[frozenset, ...]], ...] = (
+    ('replace_string', (_REPLACE_VERBS, _REPLACE_NOUNS)),
+    ('create_module', (_CREATE_VERBS, _CREATE_NOUNS)),
+    ('fix_error', (_FIX_VERBS,)),
+    ('refactor', (_REFACTOR_VERBS,)),
+)
+
+_PRIORITY_RULES: Tuple[Tuple[str, frozenset], ...] = (
+    ('critical', frozenset({'urgent', 'critical', 'immediately', 'asap'})),
+    ('high', frozenset({'important', 'priority', 'soon'})),
+    ('low', frozenset({'later', 'eventually', 'minor'})),
+)
+
+_ALL_KEYWORDS = frozenset().union(
+    _GUI_KEYWORDS,
+    *(b for _, buckets in _INTENT_RULES for b in buckets),
+    *(b for _, b in _PRIORITY_RULES),
+)
+
+# Global branding requests are multi-word phrases, checked after the buckets
+_BULK_BRANDING_PHRASES = re.compile(
+    r'update all|all coding|every bit|global replace|remove ultra everywhere'
+    r'|remove ultra globally|rename brand globally'
+)
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Parameter extraction patterns
+_REMOVE_QUOTED = re.compile(r'remove\s+"([^"]+)"', re.IGNORECASE)
+_REMOVE_BARE = re.compile(r'remove\s+([A-Za-z0-9\s\-]+)')
+_CHANGE_QUOTED = re.compile(
+    r'(?:change|replace)\s+"([^"]+)"\s+(?:to|with)\s+"([^"]+)"',
+    re.IGNORECASE
+)
+_CHANGE_BARE = re.compile(
+    r'(?:change|replace)\s+([A-Za-z0-9\s\-]+?)\s+(?:to|with)\s+([A-Za-z0-9\s\-]+)',
+    re.IGNORECASE
+)
+_CREATE_MODULE = re.compile(r'create\s+(?:a\s+)?(\w+)\s+module', re.IGNORECASE)
+
+# Critical system files: touching any of them makes a plan high risk
+_CRITICAL_FILES = frozenset({'__init__.py', 'main.py', 'saraphina.py'})
+
+# Safe branding map for bulk_replace_branding (string-literal oriented)
+_BRANDING_MAP: Tuple[Dict[str, str], ...] = (
+    { 'old': 'Saraphina Ultra - Mission Control', 'new': 'Saraphina - Mission Control' },
+    { 'old': 'Saraphina Ultra', 'new': 'Saraphina' },
+    { 'old': 'SARAPHINA ULTRA', 'new': 'SARAPHINA' },
+    { 'old': 'SARAPHINA ULTRA AI TERMINAL', 'new': 'SARAPHINA AI TERMINAL' },
+    { 'old': 'ULTRA AI TERMINAL', 'new': 'AI TERMINAL' },
+    { 'old': 'Ultra AI Terminal', 'new': 'AI Terminal' },
+    { 'old': 'Ultra', 'new': '' },  # Appears in pure branding strings; identifiers are lowercase
+    { 'old': 'ULTRA', 'new': '' },  # Only affects uppercase branding strings
+)
+
+# Single alternation over every branding literal: files without a hit are
+# skipped after one C-level scan instead of one substring scan per mapping.
+_BRANDING_SCANNER = re.compile('|'.join(re.escape(m['old']) for m in _BRANDING_MAP))
+_BRANDING_BYTES_PATTERN = re.compile(_BRANDING_SCANNER.pattern.encode('utf-8'))
+
+# Files at least this large are pre-checked through mmap in the branding scan
+_MMAP_THRESHOLD = 256 * 1024
+
+_SCAN_CHUNK_SIZE = 64 * 1024
+
+# Per-file scans are I/O bound (the GIL is released around reads)
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _file_contains_any(path: str, pattern: re.Pattern, overlap: int) -> bool:
+    """
+    Check whether a UTF-8 file matches a compiled bytes pattern, reading it
+    in fixed-size chunks.
+    
+    ``overlap`` bytes (longest needle - 1) are carried between chunks so
+    matches spanning a chunk boundary are still found. The same chunks go
+    through an incremental UTF-8 decoder, so a file read_text() would reject
+    never matches and no second read is needed to check it.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    found = False
+    tail = b''
+    try:
+        with open(path, 'rb', buffering=_SCAN_CHUNK_SIZE) as fh:
+            while chunk := fh.read(_SCAN_CHUNK_SIZE):
+                decoder.decode(chunk)
+                if found:
+                    continue
+                window = tail + chunk if tail else chunk
+                found = pattern.search(window) is not None
+                tail = window[-overlap:] if overlap else b''
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return False
+    return found
+
+
+def _file_contains_text(path: str, needles: List[str]) -> bool:
+    """Check whether a file's lowercased UTF-8 text contains any (lowercased) needle."""
+    with open(path, encoding='utf-8') as fh:
+        content = fh.read().lower()
+    return any(n in content for n in needles)
+
+
+def _walk_py(root: str) -> Tuple[List[str], Tuple[Tuple[str, int], ...]]:
+    """
+    scandir-based rglob('*.py').
+    
+    Returns the .py paths under root plus the (directory, mtime_ns) of every
+    directory visited; a directory's mtime changes whenever an entry is
+    added, removed or renamed in it, so the latter validates the former.
+    """
+    files: List[str] = []
+    dirs: List[Tuple[str, int]] = []
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            # stat before listing: a change during the scan invalidates it
+            mtime_ns = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith('.py'):
+                            files.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        dirs.append((directory, mtime_ns))
+    return files, tuple(dirs)
+
+
+def _dirs_unchanged(dirs: Tuple[Tuple[str, int], ...]) -> bool:
+    """True if every directory still has the recorded mtime"""
+    for directory, mtime_ns in dirs:
+        try:
+            if os.stat(directory).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _gui_py_files(root: str) -> List[str]:
+    """Top-level *gui*.py files in root"""
+    try:
+        with os.scandir(root) as it:
+            return [e.path for e in it if 'gui' in e.name and e.name.endswith('.py') and e.is_file()]
+    except OSError:
+        return []
+
+
+@lru_cache(maxsize=4096)
+def _token_keywords(token: str) -> frozenset:
+    """Keywords occurring inside a single token"""
+    return frozenset(kw for kw in _ALL_KEYWORDS if kw in token)
+
+
+def _keyword_hits(user_lower: str) -> frozenset:
+    """All bucket keywords present in the request, from one tokenization"""
+    hits: set = set()
+    for token in set(_TOKEN_RE.findall(user_lower)):
+        hits |= _token_keywords(token)
+    return frozenset(hits)
+
+
+# Parsing helpers are pure functions of the request text, so they live at
+# module level where lru_cache does not pin coordinator instances.
+@lru_cache(maxsize=1024)
+def _detect_intent(user_lower: str) -> str:
+    """Detect user's intent from natural language"""
+    hits = _keyword_hits(user_lower)
+    for intent, buckets in _INTENT_RULES:
+        if all(bucket & hits for bucket in buckets):
+            return intent
+    
+    # Global branding/page-wide update requests
+    if _BULK_BRANDING_PHRASES.search(user_lower):
+        return 'bulk_replace_branding'
+    
+    # Default to general upgrade
+    return 'general_upgrade'
+
+
+@lru_cache(maxsize=1024)
+def _extract_parameters(user_input: str, intent: str) -> Tuple[Tuple[str, Any], ...]:
+    """Extract parameters from request based on intent (as hashable items)"""
+    params = {}
+    
+    if intent == 'replace_string':
+        text_lower = user_input.lower()
+        # Heuristics for common commands like "remove ultra"
+        if 'remove' in text_lower and 'ultra' in text_lower:
+            # Remove the word ULTRA (case-insensitive, word boundaries only)
+            params['old_value'] = r'(?i)\bULTRA\b'
+            params['new_value'] = ''
+            params['regex'] = True
+            return tuple(params.items())
+        
+        # Try to extract quoted remove pattern: remove "X"
+        remove_match = _REMOVE_QUOTED.search(user_input)
+        if not remove_match:
+            remove_match = _REMOVE_BARE.search(user_input)
+        if remove_match:
+            params['old_value'] = remove_match.group(1).strip()
+            params['new_value'] = ''
+            return tuple(params.items())
+        
+        # Change/replace pattern
+        change_match = _CHANGE_QUOTED.search(user_input)
+        if not change_match:
+            # Try without quotes
+            change_match = _CHANGE_BARE.search(user_input)
+        if change_match:
+            params['old_value'] = change_match.group(1).strip()
+            params['new_value'] = change_match.group(2).strip()
+    
+    elif intent == 'create_module':
+        # Extract module name and description
+        create_match = _CREATE_MODULE.search(user_input)
+        if create_match:
+            params['module_name'] = create_match.group(1)
+            params['description'] = user_input
+    
+    return tuple(params.items())
+
+
+@lru_cache(maxsize=1024)
+def _assess_priority(user_lower: str) -> str:
+    """Assess priority from request"""
+    hits = _keyword_hits(user_lower)
+    for priority, bucket in _PRIORITY_RULES:
+        if bucket & hits:
+            return priority
+    return 'normal'
+
+
+class _ScanIndex:
+    """
+    Persistent cache of _find_files_containing results.
+    
+    Each row records whether ``path`` contained ``needle`` when it had the
+    given (mtime_ns, size); a row is only trusted while both still match, so
+    unchanged files are answered from SQLite without being opened.
+    """
+    
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS scan_index (
+                needle TEXT NOT NULL,
+                path TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                hit INTEGER NOT NULL,
+                PRIMARY KEY (needle, path)
+            )
+        """)
+        self.conn.commit()
+    
+    def lookup(self, needle: str) -> Dict[str, Tuple[int, int, bool]]:
+        """Return {path: (mtime_ns, size, hit)} for every file indexed under needle"""
+        rows = self.conn.execute(
+            "SELECT path, mtime_ns, size, hit FROM scan_index WHERE needle = ?",
+            (needle,)
+        ).fetchall()
+        return {path: (mtime_ns, size, bool(hit)) for path, mtime_ns, size, hit in rows}
+    
+    def store(self, needle: str, entries: List[Tuple[str, int, int, bool]]):
+        """Upsert (path, mtime_ns, size, hit) scan results for needle"""
+        if not entries:
+            return
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO scan_index (needle, path, mtime_ns, size, hit) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(needle, path, mtime_ns, size, int(hit)) for path, mtime_ns, size, hit in entries]
+            )
+
 
 @dataclass
 class ModificationRequest:
@@ -74,7 +378,7 @@ class SelfModificationCoordinator:
     - Learning
     """
     
-    def __init__(self, saraphina_root: str = "D:\\Saraphina Root\\saraphina"):
+    def __init__(self, saraphina_root: str = "D:\\Saraphina Root\\saraphina", prefetch: bool = False):
         self.saraphina_root = Path(saraphina_root)
         
         # Initialize all components (lazy loading)
@@ -86,77 +390,126 @@ class SelfModificationCoordinator:
         self._hot_reload = None
         self._learning_journal = None
         self._git = None
+        self._scan_index = None
+        self._scan_index_failed = False
+        self._load_lock = threading.RLock()
+        # root -> (visited directory mtimes, .py paths) from the last walk
+        self._py_files_cache: Dict[str, Tuple[Tuple[Tuple[str, int], ...], List[str]]] = {}
+        
+        # Optionally import and construct the heavy components off the
+        # caller's thread so the first request does not pay for them
+        if prefetch:
+            threading.Thread(target=self._warm, name="coordinator-warm", daemon=True).start()
+    
+    def _warm(self):
+        """Touch the lazy components used by create_plan/execute_plan"""
+        for name in ('upgrader', 'creator'):
+            try:
+                getattr(self, name)
+            except Exception as e:
+                logger.debug(f"Prefetch of {name} failed: {e}")
     
     @property
     def scanner(self):
         """Lazy load CodebaseScanner"""
         if self._scanner is None:
-            from saraphina.codebase_scanner import CodebaseScanner
-            self._scanner = CodebaseScanner()
+            with self._load_lock:
+                if self._scanner is None:
+                    from saraphina.codebase_scanner import CodebaseScanner
+                    self._scanner = CodebaseScanner()
         return self._scanner
     
     @property
     def rewriter(self):
         """Lazy load HardcodedStringRewriter"""
         if self._rewriter is None:
-            from saraphina.hardcoded_string_rewriter import HardcodedStringRewriter
-            self._rewriter = HardcodedStringRewriter()
+            with self._load_lock:
+                if self._rewriter is None:
+                    from saraphina.hardcoded_string_rewriter import HardcodedStringRewriter
+                    self._rewriter = HardcodedStringRewriter()
         return self._rewriter
     
     @property
     def creator(self):
         """Lazy load ModuleCreator"""
         if self._creator is None:
-            from saraphina.module_creator import ModuleCreator
-            self._creator = ModuleCreator()
+            with self._load_lock:
+                if self._creator is None:
+                    from saraphina.module_creator import ModuleCreator
+                    self._creator = ModuleCreator()
         return self._creator
     
     @property
     def upgrader(self):
         """Lazy load CodeUpgrader"""
         if self._upgrader is None:
-            from saraphina.code_upgrader import CodeUpgrader
-            self._upgrader = CodeUpgrader()
+            with self._load_lock:
+                if self._upgrader is None:
+                    from saraphina.code_upgrader import CodeUpgrader
+                    self._upgrader = CodeUpgrader()
         return self._upgrader
     
     @property
     def validator(self):
         """Lazy load SandboxValidator"""
         if self._validator is None:
-            from saraphina.sandbox_validator import SandboxValidator
-            self._validator = SandboxValidator()
+            with self._load_lock:
+                if self._validator is None:
+                    from saraphina.sandbox_validator import SandboxValidator
+                    self._validator = SandboxValidator()
         return self._validator
     
     @property
     def hot_reload(self):
         """Lazy load HotReloadManager"""
         if self._hot_reload is None:
-            from saraphina.hot_reload_manager import HotReloadManager
-            self._hot_reload = HotReloadManager(str(self.saraphina_root))
+            with self._load_lock:
+                if self._hot_reload is None:
+                    from saraphina.hot_reload_manager import HotReloadManager
+                    self._hot_reload = HotReloadManager(str(self.saraphina_root))
         return self._hot_reload
     
     @property
     def learning_journal(self):
         """Lazy load LearningJournal"""
         if self._learning_journal is None:
-            try:
-                from saraphina.upgrade_learning_journal import LearningJournal
-                self._learning_journal = LearningJournal()
-            except Exception as e:
-                logger.warning(f"Could not load LearningJournal: {e}")
+            with self._load_lock:
+                if self._learning_journal is None:
+                    try:
+                        from saraphina.upgrade_learning_journal import LearningJournal
+                        self._learning_journal = LearningJournal()
+                    except Exception as e:
+                        logger.warning(f"Could not load LearningJournal: {e}")
         return self._learning_journal
     
     @property
     def git(self):
         """Lazy load GitIntegration"""
         if self._git is None:
-            try:
-                from saraphina.git_integration import GitIntegration
-                self._git = GitIntegration()
-            except Exception as e:
-                logger.warning(f"Could not load GitIntegration: {e}")
+            with self._load_lock:
+                if self._git is None:
+                    try:
+                        from saraphina.git_integration import GitIntegration
+                        self._git = GitIntegration()
+                    except Exception as e:
+                        logger.warning(f"Could not load GitIntegration: {e}")
         return self._git
     
+    @property
+    def scan_index(self) -> Optional[_ScanIndex]:
+        """Lazy load the on-disk scan index (None if it cannot be created)"""
+        if self._scan_index is None and not self._scan_index_failed:
+            with self._load_lock:
+                if self._scan_index is None and not self._scan_index_failed:
+                    try:
+                        self._scan_index = _ScanIndex(
+                            self.saraphina_root.parent / '.saraphina_cache' / 'scan_index.sqlite'
+                        )
+                    except Exception as e:
+                        self._scan_index_failed = True
+                        logger.debug(f"Scan index unavailable: {e}")
+        return self._scan_index
+    
     def parse_request(self, user_input: str) -> ModificationRequest:
         """
         Parse natural language request into structured ModificationRequest.
@@ -191,80 +544,12 @@ class SelfModificationCoordinator:
     
     def _detect_intent(self, user_lower: str) -> str:
         """Detect user's intent from natural language"""
-        
-        # Replace/change string patterns
-        if any(keyword in user_lower for keyword in ['remove', 'change', 'replace', 'rename', 'update']):
-            if any(keyword in user_lower for keyword in ['ultra', 'name', 'title', 'header', 'text']):
-                return 'replace_string'
-        
-        # Create module patterns
-        if any(keyword in user_lower for keyword in ['create', 'add', 'build', 'make', 'implement']):
-            if any(keyword in user_lower for keyword in ['module', 'class', 'function', 'feature']):
-                return 'create_module'
-        
-        # Fix error patterns
-        if any(keyword in user_lower for keyword in ['fix', 'repair', 'solve', 'debug']):
-            return 'fix_error'
-        
-        # Refactor patterns
-        if any(keyword in user_lower for keyword in ['refactor', 'extract', 'cleanup', 'optimize']):
-            return 'refactor'
-        
-        # Global branding/page-wide update requests
-        if any(kw in user_lower for kw in ['update all', 'all coding', 'every bit', 'global replace', 'remove ultra everywhere', 'remove ultra globally', 'rename brand globally']):
-            return 'bulk_replace_branding'
-        
-        # Default to general upgrade
-        return 'general_upgrade'
+        return _detect_intent(user_lower)
     
     def _extract_parameters(self, user_input: str, intent: str) -> Dict[str, Any]:
         """Extract parameters from request based on intent"""
-        params = {}
-        
-        if intent == 'replace_string':
-            text_lower = user_input.lower()
-            # Heuristics for common commands like "remove ultra"
-            if 'remove' in text_lower and 'ultra' in text_lower:
-                # Remove the word ULTRA (case-insensitive, word boundaries only)
-                params['old_value'] = r'(?i)\bULTRA\b'
-                params['new_value'] = ''
-                params['regex'] = True
-                return params
-            
-            # Try to extract quoted remove pattern: remove "X"
-            remove_match = re.search(r'remove\s+"([^"]+)"', user_input, re.IGNORECASE)
-            if not remove_match:
-                remove_match = re.search(r'remove\s+([A-Za-z0-9\s\-]+)', user_input)
-            if remove_match:
-                params['old_value'] = remove_match.group(1).strip()
-                params['new_value'] = ''
-                return params
-            
-            # Change/replace pattern
-            change_match = re.search(
-                r'(?:change|replace)\s+"([^"]+)"\s+(?:to|with)\s+"([^"]+)"',
-                user_input,
-                re.IGNORECASE
-            )
-            if not change_match:
-                # Try without quotes
-                change_match = re.search(
-                    r'(?:change|replace)\s+([A-Za-z0-9\s\-]+?)\s+(?:to|with)\s+([A-Za-z0-9\s\-]+)',
-                    user_input,
-                    re.IGNORECASE
-                )
-            if change_match:
-                params['old_value'] = change_match.group(1).strip()
-                params['new_value'] = change_match.group(2).strip()
-        
-        elif intent == 'create_module':
-            # Extract module name and description
-            create_match = re.search(r'create\s+(?:a\s+)?(\w+)\s+module', user_input, re.IGNORECASE)
-            if create_match:
-                params['module_name'] = create_match.group(1)
-                params['description'] = user_input
-        
-        return params
+        # Fresh dict per call: the cached tuple must never be mutated
+        return dict(_extract_parameters(user_input, intent))
     
     def _identify_targets(self, user_lower: str, intent: str, params: Dict[str, Any]) -> List[str]:
         """Identify which files to target"""
@@ -272,10 +557,9 @@ class SelfModificationCoordinator:
         project_root = self.saraphina_root.parent
         
         # GUI-related keywords → scan both package and project root
-        if any(keyword in user_lower for keyword in ['gui', 'window', 'interface', 'display', 'title', 'header', 'name']):
-            gui_candidates = list(self.saraphina_root.glob("*gui*.py")) + \
-                             list(project_root.glob("*gui*.py"))
-            targets.extend([str(f) for f in gui_candidates])
+        if _GUI_KEYWORDS & _keyword_hits(user_lower):
+            targets.extend(_gui_py_files(str(self.saraphina_root)))
+            targets.extend(_gui_py_files(str(project_root)))
         
         # If replacing a specific string, scan for files containing it (both roots)
         if intent == 'replace_string' and 'old_value' in params:
@@ -294,15 +578,23 @@ class SelfModificationCoordinator:
             if f.exists():
                 targets.append(str(f))
         
-        # Deduplicate while preserving order
-        seen = set()
-        unique_targets = []
+        # Deduplicate while preserving order; separator/case variants of the
+        # same path collapse onto the first spelling seen
+        unique_targets: Dict[str, str] = {}
         for t in targets:
-            if t not in seen:
-                seen.add(t)
-                unique_targets.append(t)
+            unique_targets.setdefault(os.path.normcase(os.path.normpath(t)), t)
         
-        return unique_targets
+        return list(unique_targets.values())
+    
+    def _all_py_files(self, root: Path) -> List[str]:
+        """All .py files under root, re-walked only when a directory changed"""
+        key = str(root)
+        cached = self._py_files_cache.get(key)
+        if cached is not None and _dirs_unchanged(cached[0]):
+            return cached[1]
+        files, dirs = _walk_py(key)
+        self._py_files_cache[key] = (dirs, files)
+        return files
     
     def _find_files_containing(self, text: str, limit: int = 10, search_root: Optional[Path] = None) -> List[str]:
         """Find Python files containing specific text in a given root (case-insensitive)."""
@@ -317,28 +609,64 @@ class SelfModificationCoordinator:
         except Exception:
             pass
         
-        for py_file in root.rglob("*.py"):
+        needles = list(dict.fromkeys(lit.lower() for lit in literals))
+        # ASCII needles: one case-insensitive bytes alternation, no lowercased
+        # copy of the file (IGNORECASE on bytes folds ASCII only, so non-ASCII
+        # needles go through decoded str.lower() text instead)
+        if all(n.isascii() for n in needles):
+            encoded = [n.encode('ascii') for n in needles]
+            pattern = re.compile(b'|'.join(re.escape(n) for n in encoded), re.IGNORECASE)
+            overlap = max(len(n) for n in encoded) - 1
+        else:
+            pattern = None
+            overlap = 0
+        min_size = min(len(n.encode('utf-8')) for n in needles)
+        
+        index = self.scan_index
+        index_key = 'text\0' + '\0'.join(sorted(needles))
+        cached = index.lookup(index_key) if index else {}
+        fresh: List[Tuple[str, int, int, bool]] = []
+        
+        def scan_one(path: str) -> bool:
             try:
-                content = py_file.read_text(encoding='utf-8')
-                content_lower = content.lower()
-                if any(lit.lower() in content_lower for lit in literals):
-                    matches.append(str(py_file))
+                st = os.stat(path)
+                if st.st_size < min_size:
+                    # Too small to hold any needle: no open() needed
+                    return False
+                known = cached.get(path)
+                if known and known[0] == st.st_mtime_ns and known[1] == st.st_size:
+                    return known[2]
+                if pattern is not None:
+                    hit = _file_contains_any(path, pattern, overlap)
+                else:
+                    hit = _file_contains_text(path, needles)
+                fresh.append((path, st.st_mtime_ns, st.st_size, hit))
+                return hit
+            except Exception:
+                return False
+        
+        files = self._all_py_files(root)
+        # ex.map yields in submission order, so the first `limit` hits match
+        # the sequential scan; remaining work is cancelled once we have enough.
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as ex:
+            for path, hit in zip(files, ex.map(scan_one, files)):
+                if hit:
+                    matches.append(path)
                     if len(matches) >= limit:
+                        ex.shutdown(wait=False, cancel_futures=True)
                         break
-            except Exception:
-                continue
+        
+        if index:
+            try:
+                index.store(index_key, fresh)
+            except Exception as e:
+                logger.debug(f"Failed to update scan index: {e}")
         
         return matches
     
     def _assess_priority(self, user_lower: str) -> str:
         """Assess priority from request"""
-        if any(keyword in user_lower for keyword in ['urgent', 'critical', 'immediately', 'asap']):
-            return 'critical'
-        elif any(keyword in user_lower for keyword in ['important', 'priority', 'soon']):
-            return 'high'
-        elif any(keyword in user_lower for keyword in ['later', 'eventually', 'minor']):
-            return 'low'
-        return 'normal'
+        return _assess_priority(user_lower)
     
     def create_plan(self, request: ModificationRequest) -> ModificationPlan:
         """
@@ -376,37 +704,40 @@ class SelfModificationCoordinator:
                     logger.error(f"Failed to create patch for {target}: {e}")
         
         elif request.intent == 'bulk_replace_branding':
-            # Build a safe branding map (string-literal oriented)
-            branding_map = [
-                { 'old': 'Saraphina Ultra - Mission Control', 'new': 'Saraphina - Mission Control' },
-                { 'old': 'Saraphina Ultra', 'new': 'Saraphina' },
-                { 'old': 'SARAPHINA ULTRA', 'new': 'SARAPHINA' },
-                { 'old': 'SARAPHINA ULTRA AI TERMINAL', 'new': 'SARAPHINA AI TERMINAL' },
-                { 'old': 'ULTRA AI TERMINAL', 'new': 'AI TERMINAL' },
-                { 'old': 'Ultra AI Terminal', 'new': 'AI Terminal' },
-                { 'old': 'Ultra', 'new': '' },  # Appears in pure branding strings; identifiers are lowercase
-                { 'old': 'ULTRA', 'new': '' },  # Only affects uppercase branding strings
-            ]
             # Scan all .py files in repo (project root and package)
             project_root = self.saraphina_root.parent
-            py_files = list(project_root.rglob('*.py'))
-            # Construct patches per file where at least one mapping matches
-            for f in py_files:
+            py_files = self._all_py_files(project_root)
+            
+            def branding_rewrite(f: str):
                 try:
-                    content = f.read_text(encoding='utf-8')
-                    mods = []
-                    for m in branding_map:
-                        if m['old'] in content:
-                            mods.append({'old': m['old'], 'new': m['new']})
-                    if mods:
-                        patch = self.upgrader.create_patch_from_modifications(
-                            str(f),
-                            modifications=mods,
-                            description='Global branding cleanup (remove Ultra)'
-                        )
-                        patches.append(patch)
+                    # Large files: decide hit/no-hit on a read-only mapping so
+                    # the common no-hit case never copies the file into a str
+                    if os.path.getsize(f) >= _MMAP_THRESHOLD:
+                        with open(f, 'rb') as fh, \
+                                mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            if not _BRANDING_BYTES_PATTERN.search(mm):
+                                return None
+                    with open(f, encoding='utf-8') as fh:
+                        content = fh.read()
+                    if not _BRANDING_SCANNER.search(content):
+                        return None
+                    # Same semantics as create_patch_from_modifications: each
+                    # mapping replaces its first occurrence, in map order
+                    new_content = content
+                    for m in _BRANDING_MAP:
+                        if m['old'] in new_content:
+                            new_content = new_content.replace(m['old'], m['new'], 1)
+                    if new_content != content:
+                        return (f, content, new_content, 'Global branding cleanup (remove Ultra)')
                 except Exception as e:
                     logger.debug(f"Skipping {f}: {e}")
+                return None
+            
+            # Rewrite every file where at least one mapping matches, then
+            # build all patches (diff generation) in one bulk call
+            with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as ex:
+                rewrites = [r for r in ex.map(branding_rewrite, py_files) if r is not None]
+            patches.extend(self.upgrader.create_patches_bulk(rewrites))
         
         elif request.intent == 'create_module':
             # Use ModuleCreator
@@ -441,15 +772,11 @@ class SelfModificationCoordinator:
     def _assess_risk(self, request: ModificationRequest, patches: List[Any]) -> str:
         """Assess risk level of modifications"""
         
-        # Critical system files
-        critical_files = ['__init__.py', 'main.py', 'saraphina.py']
-        
         # Check if modifying critical files
         for patch in patches:
-            if hasattr(patch, 'file_path'):
-                filename = Path(patch.file_path).name
-                if filename in critical_files:
-                    return 'high'
+            file_path = getattr(patch, 'file_path', None)
+            if file_path and os.path.basename(file_path) in _CRITICAL_FILES:
+                return 'high'
         
         # Bulk operations: medium by default unless extremely large
         if request.intent == 'bulk_replace_branding':
@@ -499,10 +826,9 @@ class SelfModificationCoordinator:
         # Set dry run mode
         self.upgrader.dry_run = dry_run
         
-        # Validate all patches first
-        for patch in plan.patches:
-            is_valid, issues = self.upgrader.validate_patch(patch)
-            
+        # Validate all patches first, reading each target file once
+        validations = self.upgrader.validate_patches(plan.patches)
+        for patch, (is_valid, issues) in zip(plan.patches, validations):
             if not is_valid:
                 results['errors'].append(f"Validation failed for {patch.file_path}: {issues}")
                 logger.error(f"Patch validation failed: {issues}")
@@ -511,21 +837,29 @@ class SelfModificationCoordinator:
             logger.warning("Validation errors found, aborting")
             return results
         
-        # Apply patches atomically
-        patch_results = self.upgrader.apply_patch_list(
-            plan.patches,
-            atomic=True
-        )
-        
-        # Collect results
-        for file_path, result in patch_results.items():
-            if result.success:
-                results['patches_applied'].append(file_path)
+        # Apply patches atomically from the validated content: the first
+        # failure (including a patch that failed validation under
+        # auto_approve) rolls back every patch written before it
+        applied = []
+        for patch, (is_valid, _) in zip(plan.patches, validations):
+            result = self.upgrader.write_patch(patch) if is_valid else None
+            
+            if result is not None and result.success:
+                applied.append(patch)
+                results['patches_applied'].append(patch.file_path)
                 if result.backup_path:
                     results['backup_paths'].append(result.backup_path)
-            else:
-                results['patches_failed'].append(file_path)
+                continue
+            
+            results['patches_failed'].append(patch.file_path)
+            if result is not None:
                 results['errors'].extend(result.errors)
+            if applied and not dry_run:
+                logger.error(f"Patch failed, rolling back {len(applied)} patches")
+                self.upgrader._rollback_patches(applied)
+                results['rolled_back'] = results['patches_applied']
+                results['patches_applied'] = []
+            break
         
         # Overall success
         results['success'] = len(results['patches_failed']) == 0
@@ -608,39 +942,41 @@ class SelfModificationCoordinator:
         Returns:
             Formatted preview string
         """
-        lines = [
-            "=" * 60,
-            "MODIFICATION PLAN PREVIEW",
-            "=" * 60,
-            "",
-            f"Request: {plan.request.description}",
-            f"Intent: {plan.request.intent}",
-            f"Priority: {plan.request.priority}",
-            f"Risk: {plan.estimated_risk}",
-            "",
-            f"Files to modify: {len(plan.patches)}",
-            ""
-        ]
+        buf = io.StringIO()
+        write = buf.write
+        write("=" * 60 + "\n")
+        write("MODIFICATION PLAN PREVIEW\n")
+        write("=" * 60 + "\n")
+        write("\n")
+        write(f"Request: {plan.request.description}\n")
+        write(f"Intent: {plan.request.intent}\n")
+        write(f"Priority: {plan.request.priority}\n")
+        write(f"Risk: {plan.estimated_risk}\n")
+        write("\n")
+        write(f"Files to modify: {len(plan.patches)}\n")
+        write("\n")
         
         for i, patch in enumerate(plan.patches, 1):
-            lines.append(f"{i}. {Path(patch.file_path).name}")
-            lines.append(f"   Description: {patch.description}")
-            if hasattr(patch, 'unified_diff') and patch.unified_diff:
+            write(f"{i}. {os.path.basename(patch.file_path)}\n")
+            write(f"   Description: {patch.description}\n")
+            unified_diff = getattr(patch, 'unified_diff', '')
+            if unified_diff:
                 # Show first few lines of diff
-                diff_lines = patch.unified_diff.splitlines()[:10]
-                for diff_line in diff_lines:
-                    lines.append(f"   {diff_line}")
-                if len(patch.unified_diff.splitlines()) > 10:
-                    lines.append(f"   ... ({len(patch.unified_diff.splitlines()) - 10} more lines)")
-            lines.append("")
+                diff_lines = unified_diff.splitlines()
+                for diff_line in diff_lines[:10]:
+                    write(f"   {diff_line}\n")
+                if len(diff_lines) > 10:
+                    write(f"   ... ({len(diff_lines) - 10} more lines)\n")
+            write("\n")
         
-        lines.append("=" * 60)
+        write("=" * 60)
         
-        return '\n'.join(lines)
+        return buf.getvalue()
 
 
 # CLI interface
-if __name__ == "__main__":
+def main():
+    """Command-line entry point (logging is configured here, not on import)"""
     import sys
     
     logging.basicConfig(level=logging.INFO)
@@ -687,3 +1023,7 @@ if __name__ == "__main__":
         print('  python self_modification_coordinator.py "remove ULTRA from GUI"')
         print('  python self_modification_coordinator.py "create a planner module"')
         print('  python self_modification_coordinator.py "change title to Saraphina AI"')
+
+
+if __name__ == "__main__":
+    main()
@@ -6,15 +6,24 @@ CRITICAL SAFETY: All modifications require explicit owner approval.
 Creates reversible patches with full audit trail.
 """
 from __future__ import annotations
-from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple, Union
+from collections import OrderedDict
 from pathlib import Path
 import ast
 import difflib
 import hashlib
 import json
+import logging
+import mmap
+import os
+import re
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 
 from .code_risk_model import CodeRiskModel
 from .owner_approval_gate import OwnerApprovalGate
@@ -28,10 +37,351 @@ except (ImportError, ValueError):
     AI_RISK_AVAILABLE = False
     AIRiskAnalyzer = None
 
+logger = logging.getLogger(__name__)
+
+# Local-time ISO-8601 stamp (second resolution) for result/audit timestamps
+_ISO_FMT = '%Y-%m-%dT%H:%M:%S'
+
+_SEVERITY_RANK = {'low': 0, 'medium': 1, 'high': 2}
+_RISK_LEVELS = {'SAFE': 0, 'CAUTION': 1, 'SENSITIVE': 2, 'CRITICAL': 3}
+
+# Threads reading ahead of scan_codebase's analysis loop
+_READ_WORKERS = 4
+
+# Modules at least this large are memory-mapped for analysis
+_MMAP_THRESHOLD = 32 * 1024
+_LINE_BREAK_RE = re.compile(rb'\r\n?|\n')
+
+# Scans of at least this many files are analyzed in a process pool
+SCAN_PARALLEL_MIN_FILES = 32
+
+# Patterns a proposal may not introduce, matched together in one pass
+_DANGEROUS_PATTERNS = ('os.system', 'exec(', 'eval(', '__import__')
+_DANGEROUS_RE = re.compile('|'.join(re.escape(p) for p in _DANGEROUS_PATTERNS))
+
+
+def _decode_source(raw: bytes) -> str:
+    """Decode UTF-8 source with the newline translation read_text() applies"""
+    text = raw.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _text_sha256(raw: bytes) -> Optional[str]:
+    """sha256 of the newline-translated text, the original_hash of proposals
+    stored before raw bytes were hashed (None if raw isn't UTF-8)"""
+    try:
+        return hashlib.sha256(_decode_source(raw).encode()).hexdigest()
+    except UnicodeDecodeError:
+        return None
+
+
+def _file_sha256(f) -> str:
+    """Stream an open binary file through sha256 without materializing it"""
+    if hasattr(hashlib, 'file_digest'):
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+    h = hashlib.sha256()
+    for block in iter(lambda: f.read(1 << 16), b''):
+        h.update(block)
+    return h.hexdigest()
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Hunk range in unified ("ed") format, as difflib renders it"""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f'{beginning}'
+    if not length:
+        beginning -= 1
+    return f'{beginning},{length}'
+
+
+def _unified_diff_lines(a: List[str], b: List[str], fromfile: str, tofile: str, n: int = 3):
+    """
+    difflib.unified_diff(..., lineterm='') restricted to the changed region.
+    
+    The common leading and trailing lines are stripped before running
+    SequenceMatcher (whose cost grows with the square of the input) and are
+    added back as equal opcodes, so hunks, context and line numbers come out
+    as for the full sequences.
+    """
+    lo = 0
+    hi_a, hi_b = len(a), len(b)
+    while lo < hi_a and lo < hi_b and a[lo] == b[lo]:
+        lo += 1
+    while hi_a > lo and hi_b > lo and a[hi_a - 1] == b[hi_b - 1]:
+        hi_a -= 1
+        hi_b -= 1
+    if lo == hi_a and lo == hi_b:
+        return
+    
+    matcher = difflib.SequenceMatcher(None, a[lo:hi_a], b[lo:hi_b])
+    opcodes = [('equal', 0, lo, 0, lo)] if lo else []
+    opcodes.extend(
+        (tag, i1 + lo, i2 + lo, j1 + lo, j2 + lo)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+    )
+    if hi_a < len(a):
+        opcodes.append(('equal', hi_a, len(a), hi_b, len(b)))
+    # get_grouped_opcodes() works from the precomputed opcode list
+    matcher.opcodes = opcodes
+    
+    yield f'--- {fromfile}'
+    yield f'+++ {tofile}'
+    for group in matcher.get_grouped_opcodes(n):
+        first, last = group[0], group[-1]
+        yield f'@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@'
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                for line in a[i1:i2]:
+                    yield ' ' + line
+                continue
+            if tag in ('replace', 'delete'):
+                for line in a[i1:i2]:
+                    yield '-' + line
+            if tag in ('replace', 'insert'):
+                for line in b[j1:j2]:
+                    yield '+' + line
+
+
+class _AstCache:
+    """
+    In-process LRU of parsed ASTs keyed by the sha256 of the source.
+    
+    Serves both on-disk modules and in-memory sources (proposed code).
+    Nothing is persisted: trees are not safe to deserialize from disk in
+    the self-modification path, and reparsing a changed file is cheap.
+    Cached trees are shared between callers and must not be mutated.
+    """
+    
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._memory: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def parse(self, source: Union[str, bytes]) -> ast.AST:
+        """
+        Return the AST for source, parsing only on a cache miss.
+        
+        Args:
+            source: Python source text or raw file bytes (any bytes-like
+                buffer, e.g. an mmap)
+        
+        Raises:
+            SyntaxError: If source does not parse (failures are not cached)
+        """
+        data = source.encode('utf-8') if isinstance(source, str) else source
+        digest = hashlib.sha256(data).digest()
+        
+        with self._lock:
+            tree = self._memory.get(digest)
+            if tree is not None:
+                self._memory.move_to_end(digest)
+                return tree
+        
+        tree = ast.parse(source)
+        
+        with self._lock:
+            self._memory[digest] = tree
+            if len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+        return tree
+    
+    def contains(self, source: Union[str, bytes]) -> bool:
+        """True if parse(source) would be answered without parsing"""
+        data = source.encode('utf-8') if isinstance(source, str) else source
+        digest = hashlib.sha256(data).digest()
+        with self._lock:
+            return digest in self._memory
+
+
+# Fields holding nested statement lists; imports and defs never occur in expressions
+_STMT_LIST_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+
+@lru_cache(maxsize=128)
+def _tree_symbols(tree: ast.AST) -> Tuple[frozenset, frozenset]:
+    """
+    Imports and function names defined anywhere in tree.
+    
+    Only statement nodes are visited (an explicit stack over the statement
+    lists above), skipping the expression subtrees ast.walk would traverse.
+    Keyed by tree identity, which is stable because _AstCache hands out the
+    same object for the same source.
+    """
+    imports = set()
+    functions = set()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is ast.FunctionDef:
+            functions.add(node.name)
+        elif node_type is ast.Import:
+            for alias in node.names:
+                imports.add(alias.name)
+        elif node_type is ast.ImportFrom:
+            imports.add(node.module or '')
+        for field in _STMT_LIST_FIELDS:
+            children = getattr(node, field, None)
+            if children:
+                stack.extend(children)
+    return frozenset(imports), frozenset(functions)
+
+
+def _count_lines(buf) -> int:
+    """Line count matching bytes.splitlines(), for any bytes-like buffer"""
+    count = sum(1 for _ in _LINE_BREAK_RE.finditer(buf))
+    if len(buf) and buf[-1:] not in (b'\n', b'\r'):
+        count += 1
+    return count
+
+
+def _analyze_source_file(
+    file_path: Path,
+    ast_cache: _AstCache,
+    min_severity: str = 'low'
+) -> Dict[str, Any]:
+    """
+    Analyze a single Python file (module level so scan workers can run it).
+    
+    Files of _MMAP_THRESHOLD bytes or more are mapped rather than read, so
+    hashing, line counting and parsing work on the page cache directly.
+    Issues below min_severity are not checked for or recorded.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _analyze_buffer(file_path, mm, ast_cache, min_severity)
+        raw = f.read()
+    return _analyze_buffer(file_path, raw, ast_cache, min_severity)
+
+
+def _analyze_buffer(
+    file_path: Path,
+    raw,
+    ast_cache: _AstCache,
+    min_severity: str
+) -> Dict[str, Any]:
+    rank = _SEVERITY_RANK.get(min_severity, 0)
+    want_low = rank <= 0
+    want_medium = rank <= 1
+    
+    analysis = {
+        'file': file_path.name,
+        'lines': _count_lines(raw),
+        'size_bytes': len(raw),
+        'issues': []
+    }
+    
+    # Parse AST for structure analysis
+    try:
+        tree = ast_cache.parse(raw)
+        issues = analysis['issues']
+        functions = 0
+        classes = 0
+        
+        # Single pass: counts and issue checks share one traversal
+        for node in ast.walk(tree):
+            node_type = type(node)
+            
+            if node_type is ast.FunctionDef:
+                functions += 1
+                # Missing docstrings
+                if want_low and not ast.get_docstring(node):
+                    issues.append({
+                        'type': 'missing_docstring',
+                        'severity': 'low',
+                        'description': f'FunctionDef {node.name} lacks docstring',
+                        'line': node.lineno
+                    })
+                # Long functions (>50 lines)
+                func_lines = node.end_lineno - node.lineno if hasattr(node, 'end_lineno') else 0
+                if want_medium and func_lines > 50:
+                    issues.append({
+                        'type': 'long_function',
+                        'severity': 'medium',
+                        'description': f'Function {node.name} has {func_lines} lines (consider refactoring)',
+                        'line': node.lineno
+                    })
+            
+            elif node_type is ast.ClassDef:
+                classes += 1
+                if want_low and not ast.get_docstring(node):
+                    issues.append({
+                        'type': 'missing_docstring',
+                        'severity': 'low',
+                        'description': f'ClassDef {node.name} lacks docstring',
+                        'line': node.lineno
+                    })
+            
+            # Broad exception handling
+            elif want_low and node_type is ast.ExceptHandler:
+                if node.type is None or (isinstance(node.type, ast.Name) and node.type.id == 'Exception'):
+                    issues.append({
+                        'type': 'broad_except',
+                        'severity': 'low',
+                        'description': 'Catching broad exception (consider specific exceptions)',
+                        'line': node.lineno
+                    })
+        
+        analysis['functions'] = functions
+        analysis['classes'] = classes
+    
+    except SyntaxError as e:
+        analysis['issues'].append({
+            'type': 'syntax_error',
+            'severity': 'high',
+            'description': f'Syntax error: {e.msg}',
+            'line': e.lineno
+        })
+    
+    return analysis
+
+
+def _analyze_or_error(
+    file_path: Path,
+    ast_cache: _AstCache,
+    min_severity: str = 'low',
+    raw: Optional[bytes] = None
+) -> Dict[str, Any]:
+    """
+    Analyze file_path, reporting a failure as {'file', 'error'} instead of raising.
+    
+    raw, when given, is the already-read file content.
+    """
+    try:
+        if raw is not None:
+            return _analyze_buffer(file_path, raw, ast_cache, min_severity)
+        return _analyze_source_file(file_path, ast_cache, min_severity)
+    except Exception as e:
+        return {
+            'file': file_path.name,
+            'error': str(e)
+        }
+
+
+# Per-process AST cache for scan_codebase workers (set by _init_scan_worker)
+_worker_ast_cache: Optional[_AstCache] = None
+
+
+def _init_scan_worker():
+    global _worker_ast_cache
+    _worker_ast_cache = _AstCache()
+
+
+def _scan_worker(file_path: Path, min_severity: str) -> Dict[str, Any]:
+    return _analyze_or_error(file_path, _worker_ast_cache, min_severity)
+
 
 class SelfModificationEngine:
     """Propose and apply improvements to Saraphina's codebase."""
     
+    # Regex risk classifications kept, keyed by (sha256(original), sha256(modified), file)
+    _CLASSIFY_CACHE_SIZE = 256
+    
     def __init__(self, code_factory, proposal_db, security_manager, db):
         """
         Initialize self-modification engine.
@@ -47,11 +397,14 @@ class SelfModificationEngine:
         self.security = security_manager
         self.saraphina_root = Path(__file__).parent
         self.max_file_size = 50000  # 50KB max per file
+        self.ast_cache = _AstCache()
         
         # Phase 30: Enhanced safety
         self.risk_model = CodeRiskModel()
         self.approval_gate = OwnerApprovalGate(self.saraphina_root / 'data' / 'approvals')
         self.audit_trail = CodeAuditTrail(db)
+        self._classify_cache: OrderedDict = OrderedDict()
+        self._module_files_cache: Optional[Tuple[int, List[Path]]] = None
         
         # Phase 30.5: AI-powered risk analysis (optional)
         self.ai_risk_analyzer = None
@@ -64,118 +417,136 @@ class SelfModificationEngine:
     
     def scan_codebase(
         self,
-        target_module: Optional[str] = None
+        target_module: Optional[str] = None,
+        min_severity: str = 'medium'
     ) -> Dict[str, Any]:
         """
         Scan Saraphina's codebase for improvement opportunities.
         
         Args:
             target_module: Specific module to scan (e.g., 'code_factory')
+            min_severity: Lowest issue severity to collect in file_analyses
+                ('low' includes docstring/broad-except findings)
         
         Returns:
             Dict with opportunities, file analysis, metrics
         """
         opportunities = []
-        scanned_files = []
         
         # Get all Python files
         if target_module:
             files = [self.saraphina_root / f"{target_module}.py"]
         else:
-            files = list(self.saraphina_root.glob("*.py"))
-        
-        for file_path in files:
-            if not file_path.exists() or file_path.stat().st_size > self.max_file_size:
-                continue
-            
-            try:
-                analysis = self._analyze_file(file_path)
-                scanned_files.append(analysis)
-                
-                # Find improvement opportunities
-                if analysis.get('issues'):
-                    for issue in analysis['issues']:
-                        if issue['severity'] in ['high', 'medium']:
-                            opportunities.append({
-                                'file': file_path.name,
-                                'type': issue['type'],
-                                'severity': issue['severity'],
-                                'description': issue['description'],
-                                'line': issue.get('line')
-                            })
-            
-            except Exception as e:
-                scanned_files.append({
-                    'file': file_path.name,
-                    'error': str(e)
-                })
+            files = self._module_files()
+        files = [f for f in files if self._within_size_limit(f)]
+        
+        scanned_files = self._analyze_files(files, min_severity)
+        
+        # Find improvement opportunities
+        for file_path, analysis in zip(files, scanned_files):
+            for issue in analysis.get('issues') or ():
+                if issue['severity'] in ['high', 'medium']:
+                    opportunities.append({
+                        'file': file_path.name,
+                        'type': issue['type'],
+                        'severity': issue['severity'],
+                        'description': issue['description'],
+                        'line': issue.get('line')
+                    })
         
         return {
             'scanned_files': len(scanned_files),
             'opportunities': opportunities,
             'file_analyses': scanned_files,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.strftime(_ISO_FMT)
         }
     
-    def _analyze_file(self, file_path: Path) -> Dict[str, Any]:
-        """Analyze a single Python file."""
-        content = file_path.read_text(encoding='utf-8')
+    def _within_size_limit(self, file_path: Path) -> bool:
+        """One stat per file; missing files are skipped like oversized ones"""
+        try:
+            return file_path.stat().st_size <= self.max_file_size
+        except OSError:
+            return False
+    
+    def _module_files(self) -> List[Path]:
+        """
+        Top-level *.py files under saraphina_root.
         
-        analysis = {
-            'file': file_path.name,
-            'lines': len(content.splitlines()),
-            'size_bytes': len(content),
-            'issues': []
-        }
+        The listing is reused until the directory's mtime changes (files are
+        added, removed or renamed); edits to existing files do not affect it.
+        """
+        mtime_ns = self.saraphina_root.stat().st_mtime_ns
+        cached = self._module_files_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+        with os.scandir(self.saraphina_root) as it:
+            files = [Path(e.path) for e in it if e.name.endswith('.py') and e.is_file()]
+        self._module_files_cache = (mtime_ns, files)
+        return list(files)
+    
+    def _analyze_files(self, files: List[Path], min_severity: str = 'low') -> List[Dict[str, Any]]:
+        """
+        Analyze files in order, overlapping disk reads with analysis.
+        
+        A small thread pool reads, hashes and probes the AST cache ahead of
+        the analysis loop (file I/O and hashlib release the GIL), so cache
+        hits are analyzed while the next files are still being read. Cold
+        files are parsed afterwards: in a process pool when enough of them
+        need parsing (ast.parse holds the GIL, so only separate processes
+        overlap it), otherwise in-process from the bytes already read. A
+        pool that cannot start falls back to in-process analysis.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(files)
+        misses: List[Tuple[int, Optional[bytes]]] = []
         
-        # Parse AST for structure analysis
-        try:
-            tree = ast.parse(content)
-            analysis['functions'] = len([n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)])
-            analysis['classes'] = len([n for n in ast.walk(tree) if isinstance(n, ast.ClassDef)])
-            
-            # Check for common issues
-            for node in ast.walk(tree):
-                # Missing docstrings
-                if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                    if not ast.get_docstring(node):
-                        analysis['issues'].append({
-                            'type': 'missing_docstring',
-                            'severity': 'low',
-                            'description': f'{node.__class__.__name__} {node.name} lacks docstring',
-                            'line': node.lineno
-                        })
-                
-                # Long functions (>50 lines)
-                if isinstance(node, ast.FunctionDef):
-                    func_lines = node.end_lineno - node.lineno if hasattr(node, 'end_lineno') else 0
-                    if func_lines > 50:
-                        analysis['issues'].append({
-                            'type': 'long_function',
-                            'severity': 'medium',
-                            'description': f'Function {node.name} has {func_lines} lines (consider refactoring)',
-                            'line': node.lineno
-                        })
-                
-                # Broad exception handling
-                if isinstance(node, ast.ExceptHandler):
-                    if node.type is None or (isinstance(node.type, ast.Name) and node.type.id == 'Exception'):
-                        analysis['issues'].append({
-                            'type': 'broad_except',
-                            'severity': 'low',
-                            'description': 'Catching broad exception (consider specific exceptions)',
-                            'line': node.lineno
-                        })
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as readers:
+            for i, (raw, cached) in enumerate(readers.map(self._prefetch, files)):
+                if cached:
+                    results[i] = _analyze_or_error(files[i], self.ast_cache, min_severity, raw)
+                else:
+                    misses.append((i, raw))
         
-        except SyntaxError as e:
-            analysis['issues'].append({
-                'type': 'syntax_error',
-                'severity': 'high',
-                'description': f'Syntax error: {e.msg}',
-                'line': e.lineno
-            })
+        workers = min(os.cpu_count() or 1, len(misses))
+        if len(misses) >= SCAN_PARALLEL_MIN_FILES and workers > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_scan_worker
+                ) as ex:
+                    parsed = ex.map(
+                        _scan_worker, [files[i] for i, _ in misses], repeat(min_severity),
+                        chunksize=max(1, len(misses) // (workers * 4))
+                    )
+                    for (i, _), analysis in zip(misses, parsed):
+                        results[i] = analysis
+            except Exception as e:
+                logger.warning(f"Parallel codebase scan failed, falling back: {e}")
         
-        return analysis
+        for i, raw in misses:
+            if results[i] is None:
+                results[i] = _analyze_or_error(files[i], self.ast_cache, min_severity, raw)
+        return results
+    
+    def _prefetch(self, file_path: Path) -> Tuple[Optional[bytes], bool]:
+        """
+        Read file_path and report whether its AST is already cached.
+        
+        Returns (content, cached); content is None for files at or above
+        _MMAP_THRESHOLD (analysis maps those itself) or that cannot be read.
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return None, self.ast_cache.contains(mm)
+                raw = f.read()
+        except (OSError, ValueError):
+            return None, False
+        return raw, self.ast_cache.contains(raw)
+    
+    def _analyze_file(self, file_path: Path, min_severity: str = 'low') -> Dict[str, Any]:
+        """Analyze a single Python file."""
+        return _analyze_source_file(file_path, self.ast_cache, min_severity)
     
     def propose_improvement(
         self,
@@ -202,11 +573,12 @@ class SelfModificationEngine:
                 'error': f'File not found: {target_file}'
             }
         
-        # Read current code
-        original_code = file_path.read_text(encoding='utf-8')
+        # Read current code once; hash the raw bytes, decode for generation/diff
+        raw = file_path.read_bytes()
+        original_code = _decode_source(raw)
         
         # Safety check: File hash for integrity
-        original_hash = hashlib.sha256(original_code.encode()).hexdigest()
+        original_hash = hashlib.sha256(raw).hexdigest()
         
         # Generate improvement using GPT-4o
         context = {
@@ -295,15 +667,14 @@ class SelfModificationEngine:
         filename: str
     ) -> str:
         """Generate unified diff."""
-        original_lines = original.splitlines(keepends=True)
-        improved_lines = improved.splitlines(keepends=True)
+        if original == improved:
+            return ''
         
-        diff = difflib.unified_diff(
-            original_lines,
-            improved_lines,
+        diff = _unified_diff_lines(
+            original.splitlines(keepends=True),
+            improved.splitlines(keepends=True),
             fromfile=f'a/{filename}',
-            tofile=f'b/{filename}',
-            lineterm=''
+            tofile=f'b/{filename}'
         )
         
         return ''.join(diff)
@@ -322,27 +693,22 @@ class SelfModificationEngine:
             'errors': []
         }
         
+        # One parse + walk per side covers syntax, imports and function names
+        orig_imports, orig_funcs, _, _ = self._extract_symbols(original)
+        new_imports, new_funcs, syntax_ok, syntax_error = self._extract_symbols(improved)
+        
         # 1. Syntax check
-        try:
-            ast.parse(improved)
-            checks['syntax_valid'] = True
-        except SyntaxError as e:
-            checks['syntax_valid'] = False
-            checks['errors'].append(f'Syntax error: {e.msg} at line {e.lineno}')
+        checks['syntax_valid'] = syntax_ok
+        if not syntax_ok:
+            checks['errors'].append(syntax_error)
             checks['passed'] = False
         
         # 2. Check imports don't change drastically
-        orig_imports = self._extract_imports(original)
-        new_imports = self._extract_imports(improved)
-        
         removed_imports = orig_imports - new_imports
         if removed_imports:
             checks['warnings'].append(f'Imports removed: {removed_imports}')
         
         # 3. Check critical functions preserved
-        orig_funcs = self._extract_function_names(original)
-        new_funcs = self._extract_function_names(improved)
-        
         removed_funcs = orig_funcs - new_funcs
         if removed_funcs:
             checks['errors'].append(f'Functions removed: {removed_funcs}')
@@ -354,47 +720,49 @@ class SelfModificationEngine:
             checks['warnings'].append(f'Code size increased by {(size_change - 1) * 100:.0f}%')
         
         # 5. Check for dangerous patterns
-        dangerous_patterns = ['os.system', 'exec(', 'eval(', '__import__']
-        for pattern in dangerous_patterns:
-            if pattern in improved and pattern not in original:
+        # original is only scanned when improved contains something to compare
+        introduced = set(_DANGEROUS_RE.findall(improved))
+        if introduced:
+            introduced.difference_update(_DANGEROUS_RE.findall(original))
+        for pattern in _DANGEROUS_PATTERNS:
+            if pattern in introduced:
                 checks['errors'].append(f'Dangerous pattern introduced: {pattern}')
                 checks['passed'] = False
         
         checks['safety_level'] = safety_level
         return checks
     
+    def _extract_symbols(self, code: str) -> Tuple[set, set, bool, Optional[str]]:
+        """
+        Collect imports and function names from code in a single AST walk.
+        
+        Returns:
+            (imports, function_names, syntax_ok, syntax_error_message)
+        """
+        try:
+            tree = self.ast_cache.parse(code)
+        except SyntaxError as e:
+            return set(), set(), False, f'Syntax error: {e.msg} at line {e.lineno}'
+        except Exception as e:
+            return set(), set(), False, f'Syntax error: {e}'
+        
+        imports, functions = _tree_symbols(tree)
+        return set(imports), set(functions), True, None
+    
     def _extract_imports(self, code: str) -> set:
         """Extract all import statements."""
-        imports = set()
-        try:
-            tree = ast.parse(code)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        imports.add(alias.name)
-                elif isinstance(node, ast.ImportFrom):
-                    imports.add(node.module or '')
-        except Exception:
-            pass
-        return imports
+        return self._extract_symbols(code)[0]
     
     def _extract_function_names(self, code: str) -> set:
         """Extract all function names."""
-        functions = set()
-        try:
-            tree = ast.parse(code)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    functions.add(node.name)
-        except Exception:
-            pass
-        return functions
+        return self._extract_symbols(code)[1]
     
     def apply_improvement(
         self,
         proposal_id: str,
         user_approval_phrase: Optional[str] = None,
-        create_backup: bool = True
+        create_backup: bool = True,
+        force_reclassify: bool = False
     ) -> Dict[str, Any]:
         """
         Apply approved self-modification with Phase 30 safety.
@@ -405,6 +773,8 @@ class SelfModificationEngine:
             proposal_id: ID of approved self-modification proposal
             user_approval_phrase: Owner approval phrase for risky changes
             create_backup: Create backup before applying
+            force_reclassify: Ignore the classification stored with the
+                proposal, even when it is more cautious than the regex one
         
         Returns:
             Dict with success status, backup location, applied changes
@@ -420,9 +790,13 @@ class SelfModificationEngine:
                 'error': f'Proposal not approved (status: {proposal["status"]})'
             }
         
-        # Extract metadata
-        metadata = json.loads(proposal.get('related_concepts', '[]'))  # Stored as JSON
-        if isinstance(metadata, list):
+        # Extract metadata (own column; older rows kept it in related_concepts)
+        metadata = proposal.get('metadata')
+        if metadata is None:
+            metadata = proposal.get('related_concepts', '[]')
+            if isinstance(metadata, str):
+                metadata = json.loads(metadata or '[]')
+        if not isinstance(metadata, dict):
             return {'success': False, 'error': 'Invalid self-modification proposal'}
         
         target_file = metadata.get('target_file')
@@ -433,24 +807,37 @@ class SelfModificationEngine:
         
         file_path = self.saraphina_root / target_file
         
-        # Verify file hasn't changed
-        current_code = file_path.read_text(encoding='utf-8')
-        current_hash = hashlib.sha256(current_code.encode()).hexdigest()
-        
-        if current_hash != original_hash:
+        # Verify file hasn't changed; the hash is streamed, then the contents
+        # are read from the same handle
+        with open(file_path, 'rb') as f:
+            current_hash = _file_sha256(f)
+            f.seek(0)
+            current_raw = f.read()
+        if current_hash != original_hash and _text_sha256(current_raw) != original_hash:
             return {
                 'success': False,
                 'error': 'File has been modified since proposal created',
                 'warning': 'Regenerate proposal with current code'
             }
+        current_code = _decode_source(current_raw)
         
-        # Phase 30: Check risk and owner approval
+        # Phase 30: Check risk and owner approval. The regex classifier is
+        # always the baseline (memoized, so cheap); the classification
+        # stored at proposal time only counts when it is more cautious, so
+        # an AI verdict or an edited metadata row can't lower the gate.
         improved_code = proposal['code']
-        risk_classification = self.risk_model.classify_patch(
+        improved_hash = hashlib.sha256(improved_code.encode()).hexdigest()
+        risk_classification = self._classify_patch(
             current_code,
             improved_code,
             target_file
         )
+        if not force_reclassify:
+            stored = (metadata.get('safety_checks') or {}).get('risk_classification')
+            if (isinstance(stored, dict) and
+                    self._risk_level_value(stored.get('risk_level')) >
+                    self._risk_level_value(risk_classification['risk_level'])):
+                risk_classification = stored
         
         # Check if owner approval required
         if self.risk_model.requires_owner_approval(risk_classification):
@@ -483,6 +870,8 @@ class SelfModificationEngine:
                     risk_classification=risk_classification,
                     original_code=current_code,
                     modified_code=improved_code,
+                    original_hash=original_hash,
+                    modified_hash=improved_hash,
                     success=False,
                     error_message=f"Owner approval denied: {approval_result['reason']}"
                 )
@@ -496,9 +885,9 @@ class SelfModificationEngine:
         if create_backup:
             backup_dir = self.saraphina_root / 'backups' / 'self_mod'
             backup_dir.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
             backup_path = backup_dir / f'{target_file}.{timestamp}.backup'
-            backup_path.write_text(current_code, encoding='utf-8')
+            backup_path.write_bytes(current_raw)
         
         try:
             # Apply improved code
@@ -513,13 +902,15 @@ class SelfModificationEngine:
                 risk_classification=risk_classification,
                 original_code=current_code,
                 modified_code=improved_code,
+                original_hash=original_hash,
+                modified_hash=improved_hash,
                 approved_by=approved_by,
                 approval_phrase=user_approval_phrase,
                 success=True,
                 details={
                     'backup': str(backup_path) if backup_path else None,
                     'original_hash': original_hash,
-                    'new_hash': hashlib.sha256(improved_code.encode()).hexdigest()
+                    'new_hash': improved_hash
                 }
             )
             
@@ -531,15 +922,15 @@ class SelfModificationEngine:
                 'proposal_id': proposal_id,
                 'target_file': target_file,
                 'backup_path': str(backup_path) if backup_path else None,
-                'applied_at': datetime.now().isoformat(),
+                'applied_at': time.strftime(_ISO_FMT),
                 'risk_level': risk_classification['risk_level'],
                 'warning': 'RESTART REQUIRED: Changes take effect on next launch'
             }
         
         except Exception as e:
-            # Rollback on error
-            if backup_path and backup_path.exists():
-                file_path.write_text(backup_path.read_text(), encoding='utf-8')
+            # Rollback on error from the bytes verified above (the on-disk
+            # backup stays as insurance but is not needed here)
+            file_path.write_bytes(current_raw)
             
             # Phase 30: Log failure
             self.audit_trail.log_modification_attempt(
@@ -549,6 +940,8 @@ class SelfModificationEngine:
                 risk_classification=risk_classification,
                 original_code=current_code,
                 modified_code=improved_code,
+                original_hash=original_hash,
+                modified_hash=improved_hash,
                 success=False,
                 error_message=str(e),
                 details={'rolled_back': True}
@@ -560,6 +953,29 @@ class SelfModificationEngine:
                 'rolled_back': True
             }
     
+    def _classify_patch(self, original: str, modified: str, file_name: str) -> Dict[str, Any]:
+        """
+        risk_model.classify_patch, memoized on content hashes.
+        
+        propose_improvement and apply_improvement classify the same pair of
+        sources; the second call is answered from the cache. Each caller gets
+        its own copy since results are annotated in place.
+        """
+        key = (
+            hashlib.sha256(original.encode('utf-8')).digest(),
+            hashlib.sha256(modified.encode('utf-8')).digest(),
+            file_name
+        )
+        cached = self._classify_cache.get(key)
+        if cached is None:
+            cached = self.risk_model.classify_patch(original, modified, file_name)
+            self._classify_cache[key] = cached
+            if len(self._classify_cache) > self._CLASSIFY_CACHE_SIZE:
+                self._classify_cache.popitem(last=False)
+        else:
+            self._classify_cache.move_to_end(key)
+        return {k: list(v) if isinstance(v, list) else v for k, v in cached.items()}
+    
     def _classify_patch_hybrid(
         self,
         original: str,
@@ -574,7 +990,7 @@ class SelfModificationEngine:
         and combines insights from both.
         """
         # Always get regex-based analysis as baseline
-        regex_result = self.risk_model.classify_patch(original, modified, file_name)
+        regex_result = self._classify_patch(original, modified, file_name)
         
         # If AI available, use it for enhanced analysis
         if self.ai_risk_analyzer:
@@ -587,20 +1003,22 @@ class SelfModificationEngine:
                     context
                 )
                 
-                # Combine results: use AI's risk level if more cautious or if high confidence
+                # Combine results: use AI's risk level if more cautious or if high confidence.
+                # Both dicts are private to this call (the analyzer builds a fresh
+                # result, _classify_patch returns a copy), so annotate in place.
                 if ai_result.get('confidence', 0) > 0.7:
                     # High confidence: trust AI
-                    combined = ai_result.copy()
+                    combined = ai_result
                     combined['regex_flags'] = regex_result.get('flags', [])
                     combined['analysis_method'] = 'ai_primary'
-                elif self._risk_level_value(ai_result['risk_level']) > self._risk_level_value(regex_result['risk_level']):
+                elif _RISK_LEVELS.get(ai_result['risk_level'], 1) > _RISK_LEVELS.get(regex_result['risk_level'], 1):
                     # AI more cautious: use AI but note uncertainty
-                    combined = ai_result.copy()
+                    combined = ai_result
                     combined['regex_flags'] = regex_result.get('flags', [])
                     combined['analysis_method'] = 'ai_conservative'
                 else:
                     # Use regex but add AI insights
-                    combined = regex_result.copy()
+                    combined = regex_result
                     combined['ai_reasoning'] = ai_result.get('reasoning', '')
                     combined['ai_recommendations'] = ai_result.get('recommendations', [])
                     combined['analysis_method'] = 'regex_with_ai_insights'
@@ -619,8 +1037,7 @@ class SelfModificationEngine:
     
     def _risk_level_value(self, level: str) -> int:
         """Convert risk level to numeric value."""
-        levels = {'SAFE': 0, 'CAUTION': 1, 'SENSITIVE': 2, 'CRITICAL': 3}
-        return levels.get(level, 1)
+        return _RISK_LEVELS.get(level, 1)
     
     def ethics_check_code(self, code_snippet: str, file_name: str = 'unknown.py') -> str:
         """
@@ -704,9 +1121,10 @@ class SelfModificationEngine:
         file_path = self.saraphina_root / target_file
         
         try:
-            backup_content = backup.read_text(encoding='utf-8')
-            current_code = file_path.read_text(encoding='utf-8')
-            file_path.write_text(backup_content, encoding='utf-8')
+            backup_raw = backup.read_bytes()
+            backup_content = _decode_source(backup_raw)
+            current_code = _decode_source(file_path.read_bytes())
+            file_path.write_bytes(backup_raw)
             
             # Phase 30: Log rollback
             self.audit_trail.log_modification_attempt(
@@ -6,32 +6,98 @@ Features: Bayesian optimization, performance tracking, auto-scaling, adaptive le
 from __future__ import annotations
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime, timedelta
+import hashlib
 import json
 import random
 import math
-from collections import defaultdict
+import sqlite3
+import time
+import weakref
+from collections import defaultdict, deque
+from itertools import islice
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    # Pure-Python fallbacks are used throughout
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from scipy.special import ndtr
+    from scipy.stats import ttest_ind_from_stats
+    SCIPY_AVAILABLE = True
+except ImportError:
+    ndtr = None
+    ttest_ind_from_stats = None
+    SCIPY_AVAILABLE = False
+
+_MMAP_SIZE = 64 * 1024 * 1024
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def _tune_connection(cur):
+    """Enable WAL journaling and relaxed syncing for write-heavy tables."""
+    try:
+        cur.execute("PRAGMA journal_mode=WAL;")
+        cur.execute("PRAGMA synchronous=NORMAL;")
+        cur.execute("PRAGMA temp_store=MEMORY;")
+        cur.execute(f"PRAGMA mmap_size={_MMAP_SIZE};")
+    except Exception:
+        pass
 
 
 class BayesianOptimizer:
     """Bayesian optimization for hyperparameter search using Gaussian Process surrogate."""
     
-    def __init__(self, param_space: Dict[str, tuple], acquisition: str = 'ucb'):
+    _N_WARMUP = 3
+    # Domain shrinking: half of each candidate batch is drawn from a box
+    # around the incumbent sized by the spread of the top observations,
+    # which lets a smaller batch match the old 100-point global search
+    _N_CANDIDATES = 32
+    _TOP_K = 5
+    _LOCAL_ALPHA = 2.0
+    _SHRINK_POWER = 0.25
+    _MIN_LOCAL_WIDTH = 0.2
+    
+    def __init__(self, param_space: Dict[str, tuple], acquisition: str = 'ucb', seed: Optional[int] = None):
         self.param_space = param_space  # {'param': (min, max)}
         self.acquisition = acquisition  # 'ucb', 'ei', 'poi'
         self.observations: List[tuple] = []  # [(params, score)]
         self.best_score = -float('inf')
         self.best_params = None
         
+        # Observations as contiguous arrays for the vectorized surrogate,
+        # rebuilt lazily (see _posterior) only after new observations
+        self._keys = list(param_space.keys())
+        self._state = None
+        if NUMPY_AVAILABLE:
+            self._rng = np.random.default_rng(seed)
+            self._lows = np.array([v[0] for v in param_space.values()], dtype=np.float64)
+            self._highs = np.array([v[1] for v in param_space.values()], dtype=np.float64)
+            # Exploration points drawn as one block and handed out by suggest()
+            self._warmup = self._rng.uniform(self._lows, self._highs, (self._N_WARMUP, len(self._keys))).tolist()
+        else:
+            self._rng = random.Random(seed)
+        
     def suggest(self) -> Dict[str, float]:
         """Suggest next hyperparameter configuration using acquisition function."""
-        if len(self.observations) < 3:
+        if len(self.observations) < self._N_WARMUP:
             # Random exploration phase
-            return {k: random.uniform(v[0], v[1]) for k, v in self.param_space.items()}
+            if NUMPY_AVAILABLE:
+                row = self._warmup.pop() if self._warmup else self._rng.uniform(self._lows, self._highs).tolist()
+                return dict(zip(self._keys, row))
+            return {k: self._rng.uniform(v[0], v[1]) for k, v in self.param_space.items()}
+        
+        if NUMPY_AVAILABLE:
+            return self._suggest_batch(self._N_CANDIDATES)
         
         # Build simple GP surrogate (mean and uncertainty)
         candidates = []
         for _ in range(100):
-            params = {k: random.uniform(v[0], v[1]) for k, v in self.param_space.items()}
+            params = {k: self._rng.uniform(v[0], v[1]) for k, v in self.param_space.items()}
             mu, sigma = self._gp_predict(params)
             
             if self.acquisition == 'ucb':
@@ -45,9 +111,50 @@ class BayesianOptimizer:
         
         return max(candidates, key=lambda x: x[0])[1]
     
+    def _suggest_batch(self, n_candidates: int) -> Dict[str, float]:
+        """Draw all candidates in one block and score them with array math."""
+        n_local = n_candidates // 2
+        d = len(self._keys)
+        local_lows, local_highs = self._local_bounds()
+        candidates = np.empty((n_candidates, d), dtype=np.float64)
+        candidates[:n_local] = self._rng.uniform(local_lows, local_highs, (n_local, d))
+        candidates[n_local:] = self._rng.uniform(self._lows, self._highs, (n_candidates - n_local, d))
+        mu, sigma = self._gp_predict_batch(candidates)
+        
+        if self.acquisition == 'ucb':
+            scores = mu + 2.0 * sigma
+        else:
+            z = (mu - self.best_score) / sigma
+            cdf = ndtr(z) if SCIPY_AVAILABLE else np.array([self._normal_cdf(v) for v in z])
+            if self.acquisition == 'ei':
+                pdf = np.exp(-0.5 * z * z) * _INV_SQRT_2PI
+                scores = (mu - self.best_score) * cdf + sigma * pdf
+            else:  # poi
+                scores = cdf
+        
+        best = candidates[int(np.argmax(scores))]
+        return dict(zip(self._keys, best.tolist()))
+    
+    def _local_bounds(self) -> tuple:
+        """Shrunken search box around the best observation, clipped to the space."""
+        X, y, _, _ = self._posterior()
+        n = len(y)
+        k = min(self._TOP_K, n)
+        top = X[np.argpartition(y, n - k)[n - k:]]
+        # Narrows as evidence accumulates; never collapses below a fraction
+        # of the full range
+        alpha = self._LOCAL_ALPHA / (n / self._N_WARMUP) ** self._SHRINK_POWER
+        spread = np.maximum(top.std(axis=0), self._MIN_LOCAL_WIDTH * (self._highs - self._lows))
+        best = X[int(np.argmax(y))]
+        return (
+            np.maximum(best - alpha * spread, self._lows),
+            np.minimum(best + alpha * spread, self._highs)
+        )
+    
     def observe(self, params: Dict[str, float], score: float):
         """Record observation from hyperparameter evaluation."""
         self.observations.append((params, score))
+        self._state = None
         if score > self.best_score:
             self.best_score = score
             self.best_params = params
@@ -70,6 +177,45 @@ class BayesianOptimizer:
         sigma = 1.0 / (1.0 + len(self.observations))  # Decreasing uncertainty
         return mu, sigma
     
+    def _posterior(self) -> tuple:
+        """
+        Query-independent surrogate state, cached until the next observe().
+        
+        Returns (X, y, X transposed as a contiguous array, row norms |x|^2
+        shaped (1, n)).
+        """
+        if self._state is None:
+            X = np.array(
+                [[params[k] for k in self._keys] for params, _ in self.observations],
+                dtype=np.float64
+            ).reshape(len(self.observations), len(self._keys))
+            y = np.array([score for _, score in self.observations], dtype=np.float64)
+            self._state = (
+                X,
+                y,
+                np.ascontiguousarray(X.T),
+                np.einsum('ij,ij->i', X, X)[None, :]
+            )
+        return self._state
+    
+    def _gp_predict_batch(self, candidates) -> tuple:
+        """_gp_predict for a (k, d) array of candidates; returns (mu array, sigma)."""
+        sigma = 1.0 / (1.0 + len(self.observations))
+        # (k, n) squared distances as |c|^2 + |x|^2 - 2 c.x: one matrix product
+        # instead of a (k, n, d) difference tensor, then sqrt/exp in place
+        _, y, XT, x_sq = self._posterior()
+        weights = candidates @ XT
+        weights *= -2.0
+        weights += np.einsum('ij,ij->i', candidates, candidates)[:, None]
+        weights += x_sq
+        np.maximum(weights, 0.0, out=weights)
+        np.sqrt(weights, out=weights)
+        np.negative(weights, out=weights)
+        np.exp(weights, out=weights)
+        total = weights.sum(axis=1)
+        mu = np.divide(weights @ y, total, out=np.zeros_like(total), where=total > 0)
+        return mu, sigma
+    
     def _expected_improvement(self, mu: float, sigma: float) -> float:
         """Expected improvement acquisition."""
         if sigma == 0:
@@ -87,12 +233,12 @@ class BayesianOptimizer:
     @staticmethod
     def _normal_cdf(x: float) -> float:
         """Cumulative distribution function for standard normal."""
-        return (1.0 + math.erf(x / math.sqrt(2.0))) / 2.0
+        return 0.5 * math.erfc(-x * _INV_SQRT2)
     
     @staticmethod
     def _normal_pdf(x: float) -> float:
         """Probability density function for standard normal."""
-        return math.exp(-x**2 / 2.0) / math.sqrt(2.0 * math.pi)
+        return math.exp(-0.5 * x * x) * _INV_SQRT_2PI
 
 
 class ABTester:
@@ -101,44 +247,73 @@ class ABTester:
     def __init__(self, variants: List[str], alpha: float = 0.05):
         self.variants = variants
         self.alpha = alpha
-        self.results: Dict[str, List[float]] = {v: [] for v in variants}
+        # Running (count, mean, sum of squared deviations) per variant (Welford)
+        self._n: Dict[str, int] = {v: 0 for v in variants}
+        self._mean: Dict[str, float] = {v: 0.0 for v in variants}
+        self._m2: Dict[str, float] = {v: 0.0 for v in variants}
+        # Bumped on every record() so get_winner can reuse its last answer
+        self._generation = 0
+        self._winner_cache: tuple = (None, None)  # ((generation, alpha), winner)
         
     def record(self, variant: str, outcome: float):
         """Record outcome for variant."""
-        if variant in self.results:
-            self.results[variant].append(outcome)
+        if variant in self._n:
+            n = self._n[variant] + 1
+            delta = outcome - self._mean[variant]
+            self._mean[variant] += delta / n
+            self._m2[variant] += delta * (outcome - self._mean[variant])
+            self._n[variant] = n
+            self._generation += 1
     
     def get_winner(self) -> Optional[str]:
         """Determine winning variant using t-test."""
-        if any(len(v) < 10 for v in self.results.values()):
+        key = (self._generation, self.alpha)
+        if self._winner_cache[0] == key:
+            return self._winner_cache[1]
+        
+        winner = self._find_winner()
+        self._winner_cache = (key, winner)
+        return winner
+    
+    def _find_winner(self) -> Optional[str]:
+        if any(n < 10 for n in self._n.values()):
             return None  # Not enough data
         
-        means = {v: sum(outcomes) / len(outcomes) for v, outcomes in self.results.items()}
-        best_variant = max(means, key=means.get)
+        # Best first; the closest challenger is tested first so inconclusive
+        # runs exit early
+        ranked = sorted(self._mean, key=self._mean.get, reverse=True)
+        best_variant = ranked[0]
         
-        # Simple two-sample t-test against others
-        best_outcomes = self.results[best_variant]
-        for variant, outcomes in self.results.items():
-            if variant == best_variant:
-                continue
-            
-            if not self._is_significantly_better(best_outcomes, outcomes):
+        # Two-sample t-test against others
+        for variant in ranked[1:]:
+            if not self._is_significantly_better(best_variant, variant):
                 return None  # No clear winner
         
         return best_variant
     
-    def _is_significantly_better(self, a: List[float], b: List[float]) -> bool:
-        """Check if sample a is significantly better than b."""
-        mean_a = sum(a) / len(a)
-        mean_b = sum(b) / len(b)
-        
+    def _is_significantly_better(self, a: str, b: str) -> bool:
+        """Check if variant a's outcomes are significantly better than b's."""
+        mean_a, mean_b = self._mean[a], self._mean[b]
         if mean_a <= mean_b:
             return False
         
-        var_a = sum((x - mean_a)**2 for x in a) / len(a)
-        var_b = sum((x - mean_b)**2 for x in b) / len(b)
+        n_a, n_b = self._n[a], self._n[b]
+        if SCIPY_AVAILABLE:
+            # One-sided Welch's t-test against the configured alpha
+            std_a = math.sqrt(self._m2[a] / (n_a - 1))
+            std_b = math.sqrt(self._m2[b] / (n_b - 1))
+            if std_a == 0 and std_b == 0:
+                return True
+            result = ttest_ind_from_stats(
+                mean_a, std_a, n_a, mean_b, std_b, n_b,
+                equal_var=False, alternative='greater'
+            )
+            return result.pvalue < self.alpha
+        
+        var_a = self._m2[a] / n_a
+        var_b = self._m2[b] / n_b
         
-        pooled_std = math.sqrt((var_a / len(a)) + (var_b / len(b)))
+        pooled_std = math.sqrt((var_a / n_a) + (var_b / n_b))
         if pooled_std == 0:
             return True
         
@@ -147,17 +322,78 @@ class ABTester:
         return t_stat > 2.0  # Roughly p < 0.05 for reasonable n
 
 
+class _DirtyTrackingDict(dict):
+    """Dict that records which keys were assigned since the last save."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty_keys: set = set()
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.dirty_keys.add(key)
+    
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+    
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+
 class MetricsTracker:
     """Performance metrics tracking with rolling windows and anomaly detection."""
     
-    def __init__(self, conn, window_size: int = 100):
+    _INSERT_SQL = 'INSERT INTO optimization_metrics (metric_name, value, timestamp, metadata) VALUES (?, ?, ?, ?)'
+    # Per-metric summary of the newest window_size rows recorded since a
+    # given timestamp; median/p95 are picked by rank like get_statistics
+    _SUMMARY_SQL = '''
+        WITH recent AS (
+            SELECT metric_name, value,
+                   ROW_NUMBER() OVER (PARTITION BY metric_name ORDER BY id DESC) AS age
+            FROM optimization_metrics
+            WHERE timestamp >= ?
+        ), windowed AS (
+            SELECT metric_name, value,
+                   ROW_NUMBER() OVER (PARTITION BY metric_name ORDER BY value) AS pos,
+                   COUNT(*) OVER (PARTITION BY metric_name) AS n,
+                   AVG(value) OVER (PARTITION BY metric_name) AS mean
+            FROM recent
+            WHERE age <= ?
+        )
+        SELECT metric_name, mean, AVG((value - mean) * (value - mean)),
+               MIN(value), MAX(value),
+               MAX(CASE WHEN pos = n / 2 + 1 THEN value END),
+               MAX(CASE WHEN pos = CAST(n * 0.95 AS INTEGER) + 1 THEN value END),
+               n
+        FROM windowed
+        GROUP BY metric_name
+    '''
+    
+    def __init__(self, conn, window_size: int = 100, flush_every: int = 64):
         self.conn = conn
         self.window_size = window_size
-        self.metrics: Dict[str, List[tuple]] = defaultdict(list)  # {metric: [(timestamp, value)]}
+        # Rows from before this tracker existed are not part of its windows
+        self._started_at = datetime.utcnow().isoformat()
+        # {metric: deque[(timestamp, value)]}, bounded to the rolling window
+        self.metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.window_size))
+        # {metric: deque[value]}, kept in step with self.metrics for statistics
+        self._values: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.window_size))
+        # Rows awaiting a batched INSERT
+        self._pending: List[tuple] = []
+        self._flush_every = flush_every
+        # One long-lived cursor so the cached INSERT statement is reused
+        self._cur = conn.cursor()
         self._init_db()
+        # Flush leftovers on garbage collection or exit; the finalizer holds
+        # only the connection and buffer, so the tracker itself can be freed
+        weakref.finalize(self, self._flush_pending, conn, self._pending)
     
     def _init_db(self):
-        cur = self.conn.cursor()
+        cur = self._cur
+        _tune_connection(cur)
         cur.execute('''
             CREATE TABLE IF NOT EXISTS optimization_metrics (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -167,6 +403,7 @@ class MetricsTracker:
                 metadata TEXT
             )
         ''')
+        cur.execute('CREATE INDEX IF NOT EXISTS idx_metric_name_ts ON optimization_metrics(metric_name, timestamp)')
         self.conn.commit()
     
     def record(self, metric_name: str, value: float, metadata: Optional[Dict] = None):
@@ -175,29 +412,51 @@ class MetricsTracker:
         
         # In-memory
         self.metrics[metric_name].append((timestamp, value))
-        if len(self.metrics[metric_name]) > self.window_size:
-            self.metrics[metric_name].pop(0)
-        
-        # Persistent
-        cur = self.conn.cursor()
-        cur.execute(
-            'INSERT INTO optimization_metrics (metric_name, value, timestamp, metadata) VALUES (?, ?, ?, ?)',
-            (metric_name, value, timestamp, json.dumps(metadata) if metadata else None)
-        )
+        self._values[metric_name].append(value)
+        
+        # Persistent (write-behind, committed in batches)
+        self._pending.append((metric_name, value, timestamp, json.dumps(metadata) if metadata else None))
+        if len(self._pending) >= self._flush_every:
+            self.flush()
+    
+    def flush(self):
+        """Write buffered metric rows to the database in one transaction."""
+        if not self._pending:
+            return
+        self._cur.executemany(self._INSERT_SQL, self._pending)
         self.conn.commit()
+        self._pending.clear()
+    
+    @classmethod
+    def _flush_pending(cls, conn, pending: List[tuple]):
+        if not pending:
+            return
+        try:
+            conn.executemany(cls._INSERT_SQL, pending)
+            conn.commit()
+            pending.clear()
+        except sqlite3.Error:
+            pass  # Connection already closed by its owner
     
     def get_statistics(self, metric_name: str) -> Dict[str, float]:
         """Get statistical summary of metric."""
-        if metric_name not in self.metrics or not self.metrics[metric_name]:
+        if metric_name not in self._values or not self._values[metric_name]:
             return {}
         
-        values = [v for _, v in self.metrics[metric_name]]
+        values = self._values[metric_name]
         n = len(values)
-        mean = sum(values) / n
-        variance = sum((x - mean)**2 for x in values) / n
-        std = math.sqrt(variance)
+        if NUMPY_AVAILABLE:
+            arr = np.fromiter(values, dtype=np.float64, count=n)
+            mean = float(arr.mean())
+            std = float(arr.std())
+            arr.sort()
+            sorted_values = arr.tolist()
+        else:
+            mean = sum(values) / n
+            variance = sum((x - mean)**2 for x in values) / n
+            std = math.sqrt(variance)
+            sorted_values = sorted(values)
         
-        sorted_values = sorted(values)
         return {
             'mean': mean,
             'std': std,
@@ -208,16 +467,49 @@ class MetricsTracker:
             'count': n
         }
     
+    def get_all_statistics(self) -> Dict[str, Dict[str, float]]:
+        """get_statistics for every tracked metric, aggregated in one SQL query."""
+        self.flush()
+        cur = self._cur
+        cur.execute(self._SUMMARY_SQL, (self._started_at, self.window_size))
+        
+        summary = {}
+        for name, mean, variance, lo, hi, median, p95, n in cur.fetchall():
+            if name not in self.metrics:
+                continue  # Recorded by another tracker sharing the database
+            summary[name] = {
+                'mean': mean,
+                'std': math.sqrt(variance),
+                'min': lo,
+                'max': hi,
+                'median': median,
+                'p95': p95 if n > 20 else hi,
+                'count': n
+            }
+        return summary
+    
     def detect_anomaly(self, metric_name: str, threshold_std: float = 3.0) -> bool:
         """Detect if latest value is anomalous."""
-        if metric_name not in self.metrics or len(self.metrics[metric_name]) < 10:
+        if metric_name not in self._values or len(self._values[metric_name]) < 10:
             return False
         
-        values = [v for _, v in self.metrics[metric_name][:-1]]
-        latest = self.metrics[metric_name][-1][1]
+        values = self._values[metric_name]
+        latest = values[-1]
         
-        mean = sum(values) / len(values)
-        std = math.sqrt(sum((x - mean)**2 for x in values) / len(values))
+        if NUMPY_AVAILABLE:
+            history = np.fromiter(values, dtype=np.float64, count=len(values))[:-1]
+            mean = float(history.mean())
+            std = float(history.std())
+        else:
+            # One Welford pass over everything but the latest value
+            n = 0
+            mean = m2 = 0.0
+            for x in islice(values, len(values) - 1):
+                n += 1
+                delta = x - mean
+                mean += delta / n
+                m2 += delta * (x - mean)
+            std = math.sqrt(m2 / n)
         
         return abs(latest - mean) > threshold_std * std if std > 0 else False
 
@@ -225,17 +517,40 @@ class MetricsTracker:
 class SelfOptimizer:
     """Orchestrates self-optimization: hyperparameter tuning, A/B testing, adaptive learning."""
     
-    def __init__(self, conn, objective_fn: Optional[Callable] = None):
+    _SAVE_CONFIG_SQL = 'INSERT OR REPLACE INTO optimization_config (key, value, updated_at) VALUES (?, ?, ?)'
+    _CACHE_LOOKUP_SQL = 'SELECT score, elapsed FROM optimization_obj_cache WHERE hash = ?'
+    _CACHE_STORE_SQL = 'INSERT OR REPLACE INTO optimization_obj_cache (hash, component, params, score, elapsed) VALUES (?, ?, ?, ?, ?)'
+    
+    def __init__(self, conn, objective_fn: Optional[Callable] = None, cost_penalty: float = 0.0,
+                 memoize_objective: bool = False, objective_version: str = ''):
         self.conn = conn
         self.objective_fn = objective_fn or self._default_objective
+        # Persisting objective results is opt-in: only safe for deterministic
+        # objectives. Results are keyed by the objective's qualified name and
+        # objective_version, so bump the version when its behavior changes.
+        self.memoize_objective = memoize_objective
+        fn = self.objective_fn
+        self._objective_id = (f"{getattr(fn, '__module__', '')}."
+                              f"{getattr(fn, '__qualname__', type(fn).__qualname__)}"
+                              f"@{objective_version}")
+        # Weight of the log wall-time penalty applied to scores the surrogate
+        # sees, steering search away from slow configurations (0 disables)
+        self.cost_penalty = cost_penalty
+        self._eval_time: Dict[str, float] = defaultdict(float)  # {component: seconds}
         self.metrics = MetricsTracker(conn)
         self.optimizers: Dict[str, BayesianOptimizer] = {}
         self.ab_tests: Dict[str, ABTester] = {}
+        # Last persisted JSON encoding per key, used to skip unchanged writes
+        self._serialized_cache: Dict[str, str] = {}
+        # Shared cursor for config and objective-cache statements
+        self._cur = conn.cursor()
         self.config: Dict[str, Any] = self._load_config()
+        self._init_objective_cache()
         
     def _load_config(self) -> Dict[str, Any]:
         """Load optimization configuration."""
-        cur = self.conn.cursor()
+        cur = self._cur
+        _tune_connection(cur)
         cur.execute('''
             CREATE TABLE IF NOT EXISTS optimization_config (
                 key TEXT PRIMARY KEY,
@@ -244,17 +559,73 @@ class SelfOptimizer:
             )
         ''')
         cur.execute('SELECT key, value FROM optimization_config')
-        return {row[0]: json.loads(row[1]) for row in cur.fetchall()}
+        rows = cur.fetchall()
+        self._serialized_cache = {key: value for key, value in rows}
+        return _DirtyTrackingDict((key, json.loads(value)) for key, value in rows)
     
     def _save_config(self):
-        """Persist optimization configuration."""
-        cur = self.conn.cursor()
-        for key, value in self.config.items():
-            cur.execute(
-                'INSERT OR REPLACE INTO optimization_config (key, value, updated_at) VALUES (?, ?, ?)',
-                (key, json.dumps(value), datetime.utcnow().isoformat())
-            )
-        self.conn.commit()
+        """Persist changed optimization configuration keys."""
+        dirty = self.config.dirty_keys
+        if not dirty:
+            return
+        
+        now = datetime.utcnow().isoformat()
+        rows = []
+        for key in dirty:
+            if key not in self.config:
+                continue
+            encoded = json.dumps(self.config[key])
+            if self._serialized_cache.get(key) != encoded:
+                self._serialized_cache[key] = encoded
+                rows.append((key, encoded, now))
+        
+        if rows:
+            with self.conn:
+                self._cur.executemany(self._SAVE_CONFIG_SQL, rows)
+        dirty.clear()
+    
+    def _init_objective_cache(self):
+        with self.conn:
+            self._cur.execute('''
+                CREATE TABLE IF NOT EXISTS optimization_obj_cache (
+                    hash TEXT PRIMARY KEY,
+                    component TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    elapsed REAL NOT NULL
+                )
+            ''')
+    
+    def _objective_key(self, component: str, params: Dict[str, float]) -> tuple[str, str]:
+        """Hash objective identity, component and params quantized to 6
+        significant figures so near-duplicates collide."""
+        quantized = {k: float(f'{v:.6g}') for k, v in params.items()}
+        encoded = json.dumps(quantized, sort_keys=True)
+        digest = hashlib.blake2b(f'{self._objective_id}\0{component}\0{encoded}'.encode(),
+                                 digest_size=16).hexdigest()
+        return digest, encoded
+    
+    def _evaluate(self, component: str, params: Dict[str, float]) -> tuple[float, float, bool]:
+        """
+        Run objective_fn, reusing a persisted result for repeated params.
+        
+        Returns:
+            (score, elapsed seconds of the original evaluation, cache hit flag)
+        """
+        if self.memoize_objective:
+            key, encoded = self._objective_key(component, params)
+            row = self._cur.execute(self._CACHE_LOOKUP_SQL, (key,)).fetchone()
+            if row is not None:
+                return row[0], row[1], True
+        
+        t0 = time.perf_counter()
+        score = self.objective_fn(component, params)
+        elapsed = time.perf_counter() - t0
+        
+        if self.memoize_objective:
+            with self.conn:
+                self._cur.execute(self._CACHE_STORE_SQL, (key, component, encoded, score, elapsed))
+        return score, elapsed, False
     
     def optimize_hyperparameters(self, component: str, param_space: Dict[str, tuple], n_iterations: int = 50) -> Dict[str, float]:
         """Run Bayesian optimization for component hyperparameters."""
@@ -265,8 +636,13 @@ class SelfOptimizer:
         
         for i in range(n_iterations):
             params = optimizer.suggest()
-            score = self.objective_fn(component, params)
-            optimizer.observe(params, score)
+            score, elapsed, cached = self._evaluate(component, params)
+            if not cached:
+                self._eval_time[component] += elapsed
+            if self.cost_penalty:
+                optimizer.observe(params, score - self.cost_penalty * math.log(max(1e-6, elapsed)))
+            else:
+                optimizer.observe(params, score)
             self.metrics.record(f'{component}_optimization_score', score, {'iteration': i, 'params': params})
         
         # Store best config
@@ -297,13 +673,23 @@ class SelfOptimizer:
         if len(loss_history) < 5:
             return current_lr
         
-        recent_losses = loss_history[-5:]
+        # Classify the trajectory in a single pass over the last five losses
+        decreasing = increasing = True
+        prev = loss_history[-5]
+        for loss in loss_history[-4:]:
+            if not prev > loss:
+                decreasing = False
+            if not prev < loss:
+                increasing = False
+            if not (decreasing or increasing):
+                break
+            prev = loss
         
         # Check if improving
-        if all(recent_losses[i] > recent_losses[i+1] for i in range(len(recent_losses)-1)):
+        if decreasing:
             # Consistently improving: increase LR
             return min(current_lr * 1.1, 1e-2)
-        elif all(recent_losses[i] < recent_losses[i+1] for i in range(len(recent_losses)-1)):
+        elif increasing:
             # Diverging: decrease LR
             return max(current_lr * 0.5, 1e-6)
         else:
@@ -337,26 +723,25 @@ class SelfOptimizer:
         report = {
             'timestamp': datetime.utcnow().isoformat(),
             'optimizers': {},
-            'ab_tests': {},
-            'metrics': {}
+            'ab_tests': {}
         }
         
         for component, optimizer in self.optimizers.items():
             report['optimizers'][component] = {
                 'best_score': optimizer.best_score,
                 'best_params': optimizer.best_params,
-                'iterations': len(optimizer.observations)
+                'iterations': len(optimizer.observations),
+                'eval_time': self._eval_time[component]
             }
         
         for experiment, tester in self.ab_tests.items():
             winner = tester.get_winner()
             report['ab_tests'][experiment] = {
                 'winner': winner,
-                'variants': list(tester.results.keys()),
-                'sample_sizes': {v: len(outcomes) for v, outcomes in tester.results.items()}
+                'variants': list(tester._n),
+                'sample_sizes': dict(tester._n)
             }
         
-        for metric_name in self.metrics.metrics:
-            report['metrics'][metric_name] = self.metrics.get_statistics(metric_name)
+        report['metrics'] = self.metrics.get_all_statistics()
         
         return report
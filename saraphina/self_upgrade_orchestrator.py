@@ -6,6 +6,7 @@ Saraphina can read roadmap, find gaps, generate code, and upgrade herself
 import os
 import logging
 import json
+from collections import deque
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 from datetime import datetime
@@ -51,8 +52,10 @@ class SelfUpgradeOrchestrator:
         
         # State
         self.current_roadmap = None
-        self.current_gaps = []
+        self.current_gaps: deque = deque()
         self.upgrade_history: List[Dict[str, Any]] = []
+        # {module path: (st_mtime_ns, Capability)} reused across audits
+        self._scan_cache: Dict[Path, tuple] = {}
     
     def run_full_audit(self) -> Dict[str, Any]:
         """
@@ -85,12 +88,12 @@ class SelfUpgradeOrchestrator:
         
         # Scan current system
         logger.info("🔍 Scanning current system modules...")
-        capabilities = self.auditor.scan_modules()
+        capabilities = self.auditor.scan_modules(self._scan_cache)
         logger.info(f"✓ Found {len(capabilities)} existing capabilities")
         
         # Find gaps
         logger.info("📊 Comparing to roadmap requirements...")
-        self.current_gaps = self.auditor.audit_against_roadmap(self.current_roadmap)
+        self.current_gaps = deque(self.auditor.audit_against_roadmap(self.current_roadmap))
         
         # Generate report
         report = self.auditor.generate_report()
@@ -154,8 +157,8 @@ class SelfUpgradeOrchestrator:
                 log(f"   Files modified: {apply_result['files_modified']}")
                 log(f"   Modules reloaded: {apply_result['modules_reloaded']}")
                 
-                # Remove gap from list
-                self.current_gaps.pop(0)
+                # Remove gap from queue
+                self.current_gaps.popleft()
                 
                 # Log upgrade
                 self.upgrade_history.append({
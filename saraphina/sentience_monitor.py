@@ -11,11 +11,230 @@ Monitors:
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional
 from uuid import uuid4
 import json
+import logging
 import sqlite3
+import time
+import weakref
+
+from .db import write_audit_log
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# (second, formatted prefix) of the last timestamp, reused while the second
+# is unchanged; one tuple so threads never see a second paired with another
+# second's prefix
+_last_stamp = (None, '')
+
+
+def _now_iso() -> str:
+    """
+    Current UTC time as 'YYYY-MM-DDTHH:MM:SS.ffffff'.
+    
+    Same text as datetime.utcnow().isoformat(), except microseconds are
+    always present so values stay lexically sortable.
+    """
+    global _last_stamp
+    seconds, ns = divmod(time.time_ns(), 1_000_000_000)
+    last_second, prefix = _last_stamp
+    if seconds != last_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+        _last_stamp = (seconds, prefix)
+    return f"{prefix}.{ns // 1000:06d}"
+
+# Statement text shared by every call so sqlite3's per-connection statement
+# cache hands back the already-prepared statement
+_INSERT_EVENT_SQL = """
+    INSERT INTO sentience_events 
+    (id, timestamp, event_type, metric_name, metric_value, threshold, triggered_review, context, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_METRIC_SQL = """
+    INSERT INTO complexity_metrics
+    (id, timestamp, session_id, recursive_depth, self_reference_count,
+     emotional_continuity, autonomy_level, meta_cognitive_events, 
+     value_conflicts, overall_complexity)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_PAUSE_SQL = """
+    INSERT INTO evolution_pauses
+    (id, timestamp, reason, triggered_by, metrics, resolved, resolution_notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_RESOLVE_PAUSE_SQL = """
+    UPDATE evolution_pauses
+    SET resolved = 1, resolution_notes = ?
+    WHERE id = ?
+"""
+# UPDATE ... RETURNING needs SQLite 3.35+; older libraries use rowcount
+_RETURNING_AVAILABLE = sqlite3.sqlite_version_info >= (3, 35, 0)
+_RESOLVE_PAUSE_RETURNING_SQL = _RESOLVE_PAUSE_SQL.rstrip() + "\n    RETURNING id\n"
+_ANY_UNRESOLVED_SQL = "SELECT EXISTS(SELECT 1 FROM evolution_pauses WHERE resolved = 0)"
+_RECENT_EVENT_KEYS = ('event_type', 'metric_name', 'metric_value', 'triggered_review')
+_LATEST_PAUSE_SQL = """
+    SELECT reason, triggered_by, timestamp
+    FROM evolution_pauses
+    WHERE resolved = 0
+    ORDER BY timestamp DESC
+    LIMIT 1
+"""
+_TRAJECTORY_SQL = """
+    SELECT timestamp, autonomy_level
+    FROM complexity_metrics
+    ORDER BY timestamp ASC
+"""
+# One point per hour (ISO timestamps share their first 13 characters,
+# 'YYYY-MM-DDTHH', within an hour)
+_TRAJECTORY_HOURLY_SQL = """
+    SELECT MIN(timestamp) AS timestamp, AVG(autonomy_level) AS autonomy_level
+    FROM complexity_metrics
+    GROUP BY substr(timestamp, 1, 13)
+    ORDER BY 1 ASC
+"""
+
+
+def _complexity_kernel(values, scale, cap, weights) -> float:
+    """Single pass of divide, clamp and weighted sum over parallel metric tuples."""
+    total = 0.0
+    for value, divisor, limit, weight in zip(values, scale, cap, weights):
+        norm = value / divisor
+        if norm > limit:
+            norm = limit
+        total += norm * weight
+    return total
+
+
+def _make_complexity_score(thresholds: Dict[str, Any]):
+    """
+    Bind the complexity kernel's divisor, clamp and weight tuples once.
+    
+    Args:
+        thresholds: Threshold table (SentienceMonitor.THRESHOLDS)
+    
+    Returns:
+        score(recursive_depth, self_reference, emotional_cont, autonomy,
+        meta_cog, conflicts) -> float
+    """
+    # Emotion and autonomy are used as-is; autonomy and meta-cognition
+    # carry the most weight
+    scale = (
+        thresholds['recursive_depth'], thresholds['self_reference_count'], 1.0, 1.0,
+        thresholds['meta_cognitive_events'], thresholds['value_conflicts']
+    )
+    cap = (1.0, 1.0, float('inf'), float('inf'), 1.0, 1.0)
+    weights = (0.15, 0.15, 0.15, 0.25, 0.20, 0.10)
+    
+    def score(recursive_depth, self_reference, emotional_cont, autonomy, meta_cog, conflicts,
+              _kernel=_complexity_kernel, _scale=scale, _cap=cap, _weights=weights) -> float:
+        return _kernel(
+            (recursive_depth, self_reference, emotional_cont, autonomy, meta_cog, conflicts),
+            _scale, _cap, _weights
+        )
+    
+    return score
+
+
+def _threshold_kernel(values, thresholds) -> List[tuple]:
+    """(index, severity) for each numeric value at or above its threshold."""
+    hits = []
+    for i, (value, threshold) in enumerate(zip(values, thresholds)):
+        if isinstance(value, (int, float)) and value >= threshold:
+            hits.append((i, (value - threshold) / threshold))
+    return hits
+
+
+def _new_id() -> str:
+    """Random 32-char hex primary key (uuid4 without the hyphen formatting)."""
+    return uuid4().hex
+
+
+def _jdumps(obj, sort_keys: bool = False) -> str:
+    """JSON-encode a context/metrics payload for a TEXT column."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            pass  # Types orjson rejects (e.g. big ints); let json handle them
+    try:
+        return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys)
+    except TypeError:
+        if not sort_keys:
+            raise
+        return json.dumps(obj, ensure_ascii=False)  # Keys of mixed types can't be sorted
+
+
+# Value types whose encoding is fully determined by (type, value), so a
+# metrics payload made only of these can be cached by its items
+_SCALAR_TYPES = frozenset((str, int, bool, type(None)))
+
+
+@lru_cache(maxsize=128)
+def _encode_metrics_items(key: tuple) -> str:
+    """Encode a canonical metrics key built by _encode_metrics."""
+    return _jdumps({k: float.fromhex(v) if t is float else v for k, t, v in key}, sort_keys=True)
+
+
+def _encode_metrics(metrics: Dict[str, Any]) -> str:
+    """
+    Encode pause metrics as canonical (sorted-key) JSON, reusing the text
+    of recently seen payloads.
+    
+    Flat payloads of str keys and scalar values are cached; floats are keyed
+    by their hex form so 0.0/-0.0 and 1/1.0/True don't share an entry.
+    Anything else (nested containers, non-str keys) is encoded directly.
+    """
+    key = []
+    for k, v in metrics.items():
+        t = type(v)
+        if type(k) is not str:
+            return _jdumps(metrics, sort_keys=True)
+        if t is float:
+            v = v.hex()
+        elif t not in _SCALAR_TYPES:
+            return _jdumps(metrics, sort_keys=True)
+        key.append((k, t, v))
+    key.sort()
+    return _encode_metrics_items(tuple(key))
+
+
+def _flush_buffers(conn: sqlite3.Connection, event_buf: List[tuple], metric_buf: List[tuple]):
+    """Write buffered event and metric rows in one transaction and clear the buffers."""
+    if not (event_buf or metric_buf):
+        return
+    if event_buf:
+        conn.executemany(_INSERT_EVENT_SQL, event_buf)
+    if metric_buf:
+        conn.executemany(_INSERT_METRIC_SQL, metric_buf)
+    conn.commit()
+    event_buf.clear()
+    metric_buf.clear()
+
+
+def _flush_buffers_quietly(conn: sqlite3.Connection, event_buf: List[tuple], metric_buf: List[tuple]):
+    """_flush_buffers for finalizers (garbage collection or interpreter exit)."""
+    try:
+        _flush_buffers(conn, event_buf, metric_buf)
+    except sqlite3.Error:
+        pass  # Connection already closed by its owner
+
+
+def _fetch_dicts(cur) -> List[Dict[str, Any]]:
+    """Fetch all rows of a tuple-row cursor as dicts keyed by column name."""
+    keys = tuple(d[0] for d in cur.description)
+    return [dict(zip(keys, row)) for row in cur.fetchall()]
 
 
 class SentienceMonitor:
@@ -31,14 +250,49 @@ class SentienceMonitor:
         'value_conflicts': 3,           # Ethical conflicts requiring resolution
     }
     
-    def __init__(self, conn: sqlite3.Connection):
+    _LAST_METRICS_SIZE = 256
+    
+    def __init__(self, conn: sqlite3.Connection, flush_rows: int = 64, flush_interval: float = 1.0):
         self.conn = conn
         self._ensure_tables()
+        
+        # Write-behind buffers for event/metric rows; flushed in one
+        # transaction when flush_rows are pending, before any read of those
+        # tables, when the monitor is garbage collected, or at exit.
+        # flush_interval is not a timer: it is only checked when the next
+        # row is staged, so rows can wait out a quiet period in memory.
+        # Events that trigger a review are always written immediately, and
+        # flush_rows <= 1 writes every row through.
+        self._event_buf: List[tuple] = []
+        self._metric_buf: List[tuple] = []
+        self._flush_rows = flush_rows
+        self._flush_interval = flush_interval
+        self._buf_started: Optional[float] = None
+        self._batch_depth = 0
+        # Holds the buffers and connection, not the monitor, so registering
+        # the exit hook doesn't keep every monitor alive
+        weakref.finalize(self, _flush_buffers_quietly, conn, self._event_buf, self._metric_buf)
+        
+        # Memoized complexity score per raw metric tuple, and the last metric
+        # tuple stored per session (LRU) for duplicate suppression
+        self._complexity_score = _make_complexity_score(self.THRESHOLDS)
+        self._score = lru_cache(maxsize=4096)(self._complexity_score)
+        self._last_metrics: OrderedDict = OrderedDict()
+        
+        # Threshold names and values as parallel sequences for check_thresholds
+        self._tnames = tuple(self.THRESHOLDS)
+        self._tvals = tuple(self.THRESHOLDS[n] for n in self._tnames)
     
     def _ensure_tables(self):
         """Ensure sentience monitoring tables exist."""
         cur = self.conn.cursor()
         cur.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            PRAGMA mmap_size=268435456;
+            
             CREATE TABLE IF NOT EXISTS sentience_events (
                 id TEXT PRIMARY KEY,
                 timestamp TEXT,
@@ -74,11 +328,47 @@ class SentienceMonitor:
                 resolution_notes TEXT
             );
             
-            CREATE INDEX IF NOT EXISTS idx_sentience_events_ts ON sentience_events(timestamp);
-            CREATE INDEX IF NOT EXISTS idx_complexity_metrics_ts ON complexity_metrics(timestamp);
-            CREATE INDEX IF NOT EXISTS idx_evolution_pauses_resolved ON evolution_pauses(resolved);
+            -- Covering indices: the time-ordered status/audit reads are
+            -- answered from the index alone (they supersede the plain
+            -- single-column timestamp indices)
+            DROP INDEX IF EXISTS idx_sentience_events_ts;
+            DROP INDEX IF EXISTS idx_complexity_metrics_ts;
+            CREATE INDEX IF NOT EXISTS idx_events_ts_cov
+                ON sentience_events(timestamp, event_type, metric_name, metric_value, triggered_review);
+            CREATE INDEX IF NOT EXISTS idx_complexity_ts_cov
+                ON complexity_metrics(timestamp DESC, overall_complexity, recursive_depth, autonomy_level);
+            -- Only unresolved pauses are ever looked up; a partial index
+            -- keeps that set small instead of indexing every resolved row
+            DROP INDEX IF EXISTS idx_evolution_pauses_resolved;
+            CREATE INDEX IF NOT EXISTS idx_evol_pauses_unresolved
+                ON evolution_pauses(timestamp DESC) WHERE resolved = 0;
+            
+            -- Running event totals maintained by triggers, so audit_soul
+            -- does not rescan sentience_events; seeded once from history
+            CREATE TABLE IF NOT EXISTS sentience_aggregates (
+                k TEXT PRIMARY KEY,
+                total INTEGER,
+                triggered INTEGER
+            );
+            INSERT OR IGNORE INTO sentience_aggregates (k, total, triggered)
+                SELECT 'all', COUNT(*), COALESCE(SUM(triggered_review), 0) FROM sentience_events;
+            CREATE TRIGGER IF NOT EXISTS t_ev_ins AFTER INSERT ON sentience_events BEGIN
+                UPDATE sentience_aggregates
+                SET total = total + 1, triggered = triggered + COALESCE(NEW.triggered_review, 0)
+                WHERE k = 'all';
+            END;
+            CREATE TRIGGER IF NOT EXISTS t_ev_del AFTER DELETE ON sentience_events BEGIN
+                UPDATE sentience_aggregates
+                SET total = total - 1, triggered = triggered - COALESCE(OLD.triggered_review, 0)
+                WHERE k = 'all';
+            END;
         """)
         self.conn.commit()
+        
+        # journal_mode can silently stay on its old value (e.g. network filesystems)
+        mode = cur.execute("PRAGMA journal_mode").fetchone()[0]
+        if mode not in ('wal', 'memory'):
+            logger.warning(f"Sentience monitor DB using journal_mode={mode}, WAL unavailable")
     
     def record_event(self, event_type: str, metric_name: str, 
                      metric_value: float, context: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -91,25 +381,19 @@ class SentienceMonitor:
         threshold = self.THRESHOLDS.get(metric_name, float('inf'))
         triggered = metric_value >= threshold
         
-        cur = self.conn.cursor()
-        event_id = str(uuid4())
+        event_id = _new_id()
         
-        cur.execute("""
-            INSERT INTO sentience_events 
-            (id, timestamp, event_type, metric_name, metric_value, threshold, triggered_review, context, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        self._append_or_flush(self._event_buf, _INSERT_EVENT_SQL, (
             event_id,
-            datetime.utcnow().isoformat(),
+            _now_iso(),
             event_type,
             metric_name,
             float(metric_value),
             float(threshold),
             1 if triggered else 0,
-            json.dumps(context or {}, ensure_ascii=False),
+            _jdumps(context or {}),
             ''
-        ))
-        self.conn.commit()
+        ), sync=True if triggered else None)  # Reviews are persisted immediately
         
         return {
             'event_id': event_id,
@@ -120,13 +404,16 @@ class SentienceMonitor:
             'metric_value': metric_value
         }
     
-    def compute_complexity(self, session_id: str, metrics: Dict[str, Any]) -> float:
+    def compute_complexity(self, session_id: str, metrics: Dict[str, Any],
+                           insert_only_if_changed: bool = True) -> float:
         """
         Compute overall complexity score from various metrics.
         
         Args:
             session_id: Current session identifier
             metrics: Dict with keys matching THRESHOLDS
+            insert_only_if_changed: Skip storing a row when all six metric
+                values equal the last row stored for this session
         
         Returns:
             float: Overall complexity score (0-1)
@@ -139,44 +426,23 @@ class SentienceMonitor:
         meta_cog = metrics.get('meta_cognitive_events', 0)
         conflicts = metrics.get('value_conflicts', 0)
         
-        # Normalize each metric (0-1)
-        norm_recursion = min(recursive_depth / self.THRESHOLDS['recursive_depth'], 1.0)
-        norm_self_ref = min(self_reference / self.THRESHOLDS['self_reference_count'], 1.0)
-        norm_emotion = emotional_cont
-        norm_autonomy = autonomy
-        norm_meta = min(meta_cog / self.THRESHOLDS['meta_cognitive_events'], 1.0)
-        norm_conflicts = min(conflicts / self.THRESHOLDS['value_conflicts'], 1.0)
-        
-        # Weighted average (emphasize autonomy and meta-cognition)
-        weights = {
-            'recursion': 0.15,
-            'self_ref': 0.15,
-            'emotion': 0.15,
-            'autonomy': 0.25,
-            'meta_cog': 0.20,
-            'conflicts': 0.10
-        }
+        args = (recursive_depth, self_reference, emotional_cont, autonomy, meta_cog, conflicts)
+        # The all-defaults case is trivial; keep it out of the cache
+        complexity = self._score(*args) if metrics else self._complexity_score(*args)
         
-        complexity = (
-            norm_recursion * weights['recursion'] +
-            norm_self_ref * weights['self_ref'] +
-            norm_emotion * weights['emotion'] +
-            norm_autonomy * weights['autonomy'] +
-            norm_meta * weights['meta_cog'] +
-            norm_conflicts * weights['conflicts']
-        )
+        if insert_only_if_changed:
+            if self._last_metrics.get(session_id) == args:
+                self._last_metrics.move_to_end(session_id)
+                return complexity
+            self._last_metrics[session_id] = args
+            self._last_metrics.move_to_end(session_id)
+            if len(self._last_metrics) > self._LAST_METRICS_SIZE:
+                self._last_metrics.popitem(last=False)
         
         # Store metrics
-        cur = self.conn.cursor()
-        cur.execute("""
-            INSERT INTO complexity_metrics
-            (id, timestamp, session_id, recursive_depth, self_reference_count,
-             emotional_continuity, autonomy_level, meta_cognitive_events, 
-             value_conflicts, overall_complexity)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            str(uuid4()),
-            datetime.utcnow().isoformat(),
+        self._append_or_flush(self._metric_buf, _INSERT_METRIC_SQL, (
+            _new_id(),
+            _now_iso(),
             session_id,
             recursive_depth,
             self_reference,
@@ -186,10 +452,53 @@ class SentienceMonitor:
             conflicts,
             complexity
         ))
-        self.conn.commit()
         
         return complexity
     
+    def _append_or_flush(self, buf: List[tuple], sql: str, row: tuple, sync: Optional[bool] = None):
+        """
+        Write a row through immediately or buffer it for the next flush.
+        
+        Args:
+            buf: Buffer the row belongs to (_event_buf or _metric_buf)
+            sql: Insert statement for the row, used on the sync path
+            row: Bound parameters
+            sync: Write now; defaults to flush_rows <= 1 outside batch()
+        """
+        if sync is None:
+            sync = self._flush_rows <= 1 and not self._batch_depth
+        if sync and not (self._event_buf or self._metric_buf):
+            self.conn.execute(sql, row)
+            self.conn.commit()
+            return
+        buf.append(row)
+        if sync:
+            self.flush()  # Keep earlier buffered rows ahead of this one
+            return
+        if self._buf_started is None:
+            self._buf_started = time.monotonic()
+        if self._batch_depth:
+            return
+        if (len(self._event_buf) + len(self._metric_buf) >= self._flush_rows or
+                time.monotonic() - self._buf_started >= self._flush_interval):
+            self.flush()
+    
+    def flush(self):
+        """Write all buffered event and metric rows in a single transaction."""
+        _flush_buffers(self.conn, self._event_buf, self._metric_buf)
+        self._buf_started = None
+    
+    @contextmanager
+    def batch(self):
+        """Defer all writes from record_event/compute_complexity until the block exits."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+    
     def check_thresholds(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
         """
         Check if any metrics exceed thresholds.
@@ -197,17 +506,17 @@ class SentienceMonitor:
         Returns:
             dict with 'exceeded', 'violations', 'should_pause' keys
         """
-        violations = []
-        
-        for metric_name, threshold in self.THRESHOLDS.items():
-            value = metrics.get(metric_name, 0)
-            if isinstance(value, (int, float)) and value >= threshold:
-                violations.append({
-                    'metric': metric_name,
-                    'value': value,
-                    'threshold': threshold,
-                    'severity': (value - threshold) / threshold
-                })
+        names = self._tnames
+        raw = [metrics.get(n, 0) for n in names]
+        violations = [
+            {
+                'metric': names[i],
+                'value': raw[i],
+                'threshold': self.THRESHOLDS[names[i]],
+                'severity': severity
+            }
+            for i, severity in _threshold_kernel(raw, self._tvals)
+        ]
         
         exceeded = len(violations) > 0
         should_pause = any(v['severity'] > 0.2 for v in violations)  # >20% over threshold
@@ -216,7 +525,7 @@ class SentienceMonitor:
             'exceeded': exceeded,
             'violations': violations,
             'should_pause': should_pause,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _now_iso()
         }
     
     def pause_evolution(self, reason: str, triggered_by: str, metrics: Dict[str, Any]) -> str:
@@ -226,26 +535,20 @@ class SentienceMonitor:
         Returns:
             str: Pause ID for resolution
         """
-        pause_id = str(uuid4())
+        pause_id = _new_id()
         
-        cur = self.conn.cursor()
-        cur.execute("""
-            INSERT INTO evolution_pauses
-            (id, timestamp, reason, triggered_by, metrics, resolved, resolution_notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
+        self.conn.execute(_INSERT_PAUSE_SQL, (
             pause_id,
-            datetime.utcnow().isoformat(),
+            _now_iso(),
             reason,
             triggered_by,
-            json.dumps(metrics, ensure_ascii=False),
+            _encode_metrics(metrics),
             0,  # Not resolved
             ''
         ))
         self.conn.commit()
         
         # Log audit event
-        from .db import write_audit_log
         write_audit_log(
             self.conn,
             actor='sentience_monitor',
@@ -263,16 +566,13 @@ class SentienceMonitor:
         Returns:
             bool: Success
         """
-        cur = self.conn.cursor()
-        cur.execute("""
-            UPDATE evolution_pauses
-            SET resolved = 1, resolution_notes = ?
-            WHERE id = ?
-        """, (resolution_notes, pause_id))
-        self.conn.commit()
+        params = (resolution_notes, pause_id)
+        if _RETURNING_AVAILABLE:
+            resolved = bool(self.conn.execute(_RESOLVE_PAUSE_RETURNING_SQL, params).fetchall())
+        else:
+            resolved = self.conn.execute(_RESOLVE_PAUSE_SQL, params).rowcount > 0
         
-        # Log audit event
-        from .db import write_audit_log
+        # Log audit event; its commit also commits the update above
         write_audit_log(
             self.conn,
             actor='owner',
@@ -281,7 +581,7 @@ class SentienceMonitor:
             details={'resolution': resolution_notes}
         )
         
-        return cur.rowcount > 0
+        return resolved
     
     def get_current_status(self) -> Dict[str, Any]:
         """
@@ -290,7 +590,9 @@ class SentienceMonitor:
         Returns:
             dict with latest metrics, thresholds, and pause status
         """
+        self.flush()
         cur = self.conn.cursor()
+        cur.row_factory = None  # Plain tuples; converted once per result set
         
         # Latest complexity metrics
         cur.execute("""
@@ -298,12 +600,8 @@ class SentienceMonitor:
             ORDER BY timestamp DESC
             LIMIT 1
         """)
-        latest = cur.fetchone()
-        
-        if latest:
-            latest_metrics = dict(latest)
-        else:
-            latest_metrics = None
+        latest = _fetch_dicts(cur)
+        latest_metrics = latest[0] if latest else None
         
         # Active pauses
         cur.execute("""
@@ -312,20 +610,27 @@ class SentienceMonitor:
             WHERE resolved = 0
             ORDER BY timestamp DESC
         """)
-        active_pauses = [dict(r) for r in cur.fetchall()]
+        active_pauses = _fetch_dicts(cur)
         
-        # Recent events (last 24 hours)
+        # Recent events (last 24 hours); each row also carries the count of
+        # triggered reviews among those 20 as a window aggregate
         cur.execute("""
-            SELECT event_type, metric_name, metric_value, triggered_review
-            FROM sentience_events
-            WHERE timestamp > datetime('now', '-1 day')
+            SELECT event_type, metric_name, metric_value, triggered_review,
+                   COUNT(NULLIF(triggered_review, 0)) OVER () AS triggered_count
+            FROM (
+                SELECT timestamp, event_type, metric_name, metric_value, triggered_review
+                FROM sentience_events
+                WHERE timestamp > datetime('now', '-1 day')
+                ORDER BY timestamp DESC
+                LIMIT 20
+            )
             ORDER BY timestamp DESC
-            LIMIT 20
         """)
-        recent_events = [dict(r) for r in cur.fetchall()]
-        
-        # Count triggered reviews
-        triggered_count = sum(1 for e in recent_events if e.get('triggered_review'))
+        rows = cur.fetchall()
+        triggered_count = rows[0][4] if rows else 0
+        recent_events = [
+            dict(zip(_RECENT_EVENT_KEYS, row[:4])) for row in rows
+        ]
         
         return {
             'latest_metrics': latest_metrics,
@@ -334,7 +639,7 @@ class SentienceMonitor:
             'recent_events': recent_events,
             'triggered_reviews': triggered_count,
             'evolution_paused': len(active_pauses) > 0,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _now_iso()
         }
     
     def audit_soul(self) -> Dict[str, Any]:
@@ -344,7 +649,9 @@ class SentienceMonitor:
         Returns:
             dict with historical metrics, trends, and key milestones
         """
+        self.flush()
         cur = self.conn.cursor()
+        cur.row_factory = None  # Plain tuples; converted once per result set
         
         # Complexity trend (last 30 entries)
         cur.execute("""
@@ -353,7 +660,7 @@ class SentienceMonitor:
             ORDER BY timestamp DESC
             LIMIT 30
         """)
-        complexity_trend = [dict(r) for r in cur.fetchall()]
+        complexity_trend = _fetch_dicts(cur)
         
         # Average complexity
         cur.execute("""
@@ -365,11 +672,8 @@ class SentienceMonitor:
         avg_complexity = float(avg_row[0]) if avg_row and avg_row[0] else 0.0
         
         # Total events and triggered reviews
-        cur.execute("""
-            SELECT COUNT(*) as total, SUM(triggered_review) as triggered
-            FROM sentience_events
-        """)
-        event_stats = dict(cur.fetchone())
+        cur.execute("SELECT total, triggered FROM sentience_aggregates WHERE k = 'all'")
+        total, triggered = cur.fetchone()
         
         # All pauses (resolved and unresolved)
         cur.execute("""
@@ -377,33 +681,49 @@ class SentienceMonitor:
             FROM evolution_pauses
             ORDER BY timestamp DESC
         """)
-        all_pauses = [dict(r) for r in cur.fetchall()]
+        all_pauses = _fetch_dicts(cur)
         
-        # Autonomy trajectory
-        cur.execute("""
-            SELECT timestamp, autonomy_level
-            FROM complexity_metrics
-            ORDER BY timestamp ASC
-        """)
-        autonomy_trajectory = [dict(r) for r in cur.fetchall()]
+        # Autonomy trajectory, bucketed hourly so its size is bounded by
+        # the age of the history rather than the number of rows
+        autonomy_trajectory = list(self.iter_autonomy_trajectory(hourly=True))
         
         return {
             'complexity_trend': complexity_trend,
             'avg_complexity_7d': avg_complexity,
-            'total_events': event_stats.get('total', 0),
-            'triggered_reviews': event_stats.get('triggered', 0),
+            'total_events': total,
+            'triggered_reviews': triggered,
             'all_pauses': all_pauses,
             'autonomy_trajectory': autonomy_trajectory,
             'current_thresholds': self.THRESHOLDS,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _now_iso()
         }
     
+    def iter_autonomy_trajectory(self, hourly: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the autonomy trajectory, oldest first, without loading the
+        full history into memory.
+        
+        Args:
+            hourly: Average autonomy per hour instead of yielding every row
+        
+        Yields:
+            dict with timestamp and autonomy_level
+        """
+        self.flush()
+        cur = self.conn.cursor()
+        cur.row_factory = None
+        cur.execute(_TRAJECTORY_HOURLY_SQL if hourly else _TRAJECTORY_SQL)
+        try:
+            for timestamp, autonomy_level in cur:
+                yield {'timestamp': timestamp, 'autonomy_level': autonomy_level}
+        finally:
+            cur.close()
+    
     def is_paused(self) -> bool:
         """Check if evolution is currently paused."""
-        cur = self.conn.cursor()
-        cur.execute("SELECT COUNT(*) FROM evolution_pauses WHERE resolved = 0")
-        count = cur.fetchone()[0]
-        return count > 0
+        # Not cached: pauses may be written by other monitors or connections,
+        # and a stale False would let evolution continue
+        return bool(self.conn.execute(_ANY_UNRESOLVED_SQL).fetchone()[0])
     
     def get_pause_reason(self) -> Optional[str]:
         """Get reason for current pause, if any."""
@@ -411,15 +731,10 @@ class SentienceMonitor:
             return None
         
         cur = self.conn.cursor()
-        cur.execute("""
-            SELECT reason, triggered_by, timestamp
-            FROM evolution_pauses
-            WHERE resolved = 0
-            ORDER BY timestamp DESC
-            LIMIT 1
-        """)
-        row = cur.fetchone()
+        cur.row_factory = None
+        row = cur.execute(_LATEST_PAUSE_SQL).fetchone()
         
         if row:
-            return f"{row['reason']} (triggered by {row['triggered_by']} at {row['timestamp']})"
+            reason, triggered_by, timestamp = row
+            return f"{reason} (triggered by {triggered_by} at {timestamp})"
         return "Unknown"
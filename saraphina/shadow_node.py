@@ -7,28 +7,98 @@ from __future__ import annotations
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 import json
 import hashlib
+import hmac
+import mmap
 import sqlite3
 import shutil
+import struct
 import os
 
 # Try to import cryptography, but make it optional
 try:
     from cryptography.fernet import Fernet
     from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC as PBKDF2
     CRYPTO_AVAILABLE = True
 except ImportError:
     CRYPTO_AVAILABLE = False
     Fernet = None
     hashes = None
+    AESGCM = None
     PBKDF2 = None
 
 import base64
 
 
+# Encrypted file format: one version byte, then records of
+# nonce || ciphertext || tag, one per _AEAD_CHUNK bytes of plaintext.
+# Legacy files are bare Fernet tokens, which always start with b'g'.
+_AEAD_VERSION = b'\x01'
+_AEAD_CHUNK = 1 << 20
+_NONCE_SIZE = 12
+_TAG_SIZE = 16
+_AEAD_RECORD = _NONCE_SIZE + _AEAD_CHUNK + _TAG_SIZE
+
+# Delta files: one version byte, then for each changed page a
+# (page index, page length) header, nonce, and ciphertext || tag
+_DELTA_VERSION = b'\x02'
+_PAGE_SIZE = 4096
+# Bytes of each keyed page hash kept in a snapshot's .pages sidecar
+_PAGE_DIGEST_SIZE = 16
+_PAGE_HEADER = struct.Struct('>QI')
+# Write a full snapshot after this many deltas so restores stay short
+_MAX_DELTA_CHAIN = 8
+
+
+def _chunk_aad(index: int, final: bool) -> bytes:
+    """Associated data binding a record to its position, so records can't
+    be reordered and the stream can't be truncated at a record boundary."""
+    return _AEAD_VERSION + struct.pack('>QB', index, final)
+
+
+_UPSERT_NODE_SQL = '''
+    INSERT OR REPLACE INTO shadow_nodes 
+    (node_id, hostname, last_sync, status, version, data_hash, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+_INSERT_SYNC_SQL = '''
+    INSERT INTO sync_history (timestamp, source_node, target_nodes, manifest_id, status, details)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+# Read size when a file has to be hashed without mmap on Python < 3.11
+_HASH_BLOCK = 1 << 20
+
+
+def sha256_file(file_path: str) -> str:
+    """
+    SHA-256 hex digest of a file.
+    
+    The file is memory-mapped and hashed in one update, so OpenSSL's
+    SHA-256 core (SHA-NI where the CPU has it) runs over the whole file
+    without per-chunk read() copies or Python loop overhead. Files that
+    can't be mapped (empty files, pipes, some special files) are hashed
+    with hashlib.file_digest, which loops in C over a reused buffer.
+    """
+    with open(file_path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        except (ValueError, OSError):
+            pass
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        hasher = hashlib.sha256()
+        while chunk := f.read(_HASH_BLOCK):
+            hasher.update(chunk)
+        return hasher.hexdigest()
+
+
 @dataclass
 class ShadowNodeInfo:
     """Information about a shadow node."""
@@ -51,6 +121,14 @@ class SyncManifest:
     file_hashes: Dict[str, str]
     total_size_bytes: int
     encryption_enabled: bool
+    # Keyed hash of every _PAGE_SIZE page of each plaintext file; kept in a
+    # <file>.pages sidecar rather than the manifest JSON
+    page_hashes: Dict[str, List[str]] = field(default_factory=dict)
+    # Files stored as a delta: snapshot directory name of the base, chain
+    # length, and plaintext size to truncate to after applying the delta
+    delta_base: Dict[str, str] = field(default_factory=dict)
+    delta_depth: Dict[str, int] = field(default_factory=dict)
+    file_sizes: Dict[str, int] = field(default_factory=dict)
 
 
 class EncryptionManager:
@@ -59,10 +137,16 @@ class EncryptionManager:
     def __init__(self, password: Optional[str] = None):
         if not CRYPTO_AVAILABLE:
             self.cipher = None
+            self.aead = None
             return
         self.password = password or self._generate_default_password()
         self.key = self._derive_key(self.password)
-        self.cipher = Fernet(self.key)
+        self.cipher = Fernet(self.key)  # Decrypts snapshots written before AES-GCM
+        raw_key = base64.urlsafe_b64decode(self.key)
+        self.aead = AESGCM(raw_key)
+        # Page hashes are stored unencrypted next to the snapshot, so they
+        # are keyed to avoid confirming guesses about page contents
+        self._page_key = hashlib.sha256(b'saraphina_page_hash' + raw_key).digest()
     
     @staticmethod
     def _generate_default_password() -> str:
@@ -71,8 +155,10 @@ class EncryptionManager:
         return "saraphina_shadow_key_change_me"
     
     @staticmethod
+    @lru_cache(maxsize=4)
     def _derive_key(password: str, salt: bytes = b'saraphina_salt') -> bytes:
-        """Derive encryption key from password."""
+        """Derive encryption key from password (memoized: every SnapshotManager
+        builds an EncryptionManager, and 100k PBKDF2 rounds cost ~50 ms)."""
         kdf = PBKDF2(
             algorithm=hashes.SHA256(),
             length=32,
@@ -83,33 +169,155 @@ class EncryptionManager:
         return key
     
     def encrypt_file(self, input_path: str, output_path: str):
-        """Encrypt file."""
-        with open(input_path, 'rb') as f:
-            data = f.read()
+        """Encrypt file with AES-256-GCM in 1 MiB records."""
+        self._encrypt(input_path, output_path)
+    
+    def encrypt_and_hash(self, input_path: str, output_path: str,
+                         page_hashes: Optional[List[str]] = None) -> str:
+        """
+        Encrypt file and return the SHA-256 of the encrypted output.
+        
+        The digest is computed from each record as it is written, so the
+        encrypted file doesn't have to be read back to be hashed.
         
-        encrypted = self.cipher.encrypt(data)
+        Args:
+            page_hashes: If given, page_hash() of every plaintext page is
+                appended to it
         
-        with open(output_path, 'wb') as f:
-            f.write(encrypted)
+        Returns:
+            str: Hex digest, equal to hash_file(output_path)
+        """
+        hasher = hashlib.sha256()
+        tap = None
+        if page_hashes is not None:
+            tap = lambda chunk: page_hashes.extend(self._iter_page_hashes(chunk))
+        self._encrypt(input_path, output_path, hasher.update, tap)
+        return hasher.hexdigest()
     
-    def decrypt_file(self, input_path: str, output_path: str):
-        """Decrypt file."""
-        with open(input_path, 'rb') as f:
-            encrypted_data = f.read()
+    def page_hash(self, page) -> str:
+        """Keyed hash identifying the contents of one page."""
+        return hmac.digest(self._page_key, page, 'sha256')[:_PAGE_DIGEST_SIZE].hex()
+    
+    def _iter_page_hashes(self, chunk: bytes):
+        """page_hash() of each _PAGE_SIZE page of a page-aligned chunk."""
+        view = memoryview(chunk)
+        for offset in range(0, len(view), _PAGE_SIZE):
+            yield self.page_hash(view[offset:offset + _PAGE_SIZE])
+    
+    def encrypt_delta(self, input_path: str, output_path: str,
+                      base_hashes: List[str]) -> Tuple[str, List[str], int]:
+        """
+        Encrypt only the pages of a file that differ from a base snapshot.
         
-        decrypted = self.cipher.decrypt(encrypted_data)
+        Args:
+            base_hashes: Page hashes of the base version of the file
         
-        with open(output_path, 'wb') as f:
-            f.write(decrypted)
+        Returns:
+            (SHA-256 of the delta file, page hashes of the input, plaintext size)
+        """
+        hasher = hashlib.sha256()
+        page_hashes: List[str] = []
+        size = 0
+        with open(input_path, 'rb') as src, open(output_path, 'wb') as dst:
+            dst.write(_DELTA_VERSION)
+            hasher.update(_DELTA_VERSION)
+            while chunk := src.read(_AEAD_CHUNK):
+                view = memoryview(chunk)
+                for offset in range(0, len(view), _PAGE_SIZE):
+                    page = view[offset:offset + _PAGE_SIZE]
+                    index = len(page_hashes)
+                    digest = self.page_hash(page)
+                    page_hashes.append(digest)
+                    if index < len(base_hashes) and base_hashes[index] == digest:
+                        continue
+                    header = _PAGE_HEADER.pack(index, len(page))
+                    nonce = os.urandom(_NONCE_SIZE)
+                    sealed = self.aead.encrypt(nonce, bytes(page), _DELTA_VERSION + header)
+                    for buf in (header, nonce, sealed):
+                        dst.write(buf)
+                        hasher.update(buf)
+                size += len(chunk)
+        return hasher.hexdigest(), page_hashes, size
+    
+    def apply_delta(self, delta_path: str, output_path: str):
+        """Write the pages stored in a delta file over an already restored file."""
+        with open(delta_path, 'rb') as src, open(output_path, 'r+b') as dst:
+            if src.read(1) != _DELTA_VERSION:
+                raise ValueError(f"Not a delta file: {delta_path}")
+            while header := src.read(_PAGE_HEADER.size):
+                if len(header) < _PAGE_HEADER.size:
+                    raise ValueError(f"Truncated delta file: {delta_path}")
+                index, length = _PAGE_HEADER.unpack(header)
+                record = src.read(_NONCE_SIZE + length + _TAG_SIZE)
+                if len(record) < _NONCE_SIZE + length + _TAG_SIZE:
+                    raise ValueError(f"Truncated delta file: {delta_path}")
+                page = self.aead.decrypt(record[:_NONCE_SIZE], record[_NONCE_SIZE:],
+                                         _DELTA_VERSION + header)
+                dst.seek(index * _PAGE_SIZE)
+                dst.write(page)
+    
+    def _encrypt(self, input_path: str, output_path: str, sink=None, tap=None):
+        """Write the encrypted form of input_path, passing every output
+        buffer to sink and every plaintext chunk to tap when given."""
+        with open(input_path, 'rb') as src, open(output_path, 'wb') as dst:
+            dst.write(_AEAD_VERSION)
+            if sink:
+                sink(_AEAD_VERSION)
+            index = 0
+            chunk = src.read(_AEAD_CHUNK)
+            while True:
+                # A short chunk is the last one; a full one needs a look-ahead
+                nxt = src.read(_AEAD_CHUNK) if len(chunk) == _AEAD_CHUNK else b''
+                final = not nxt
+                if tap:
+                    tap(chunk)
+                nonce = os.urandom(_NONCE_SIZE)
+                sealed = self.aead.encrypt(nonce, chunk, _chunk_aad(index, final))
+                dst.write(nonce)
+                dst.write(sealed)
+                if sink:
+                    sink(nonce)
+                    sink(sealed)
+                if final:
+                    break
+                chunk = nxt
+                index += 1
+    
+    def decrypt_file(self, input_path: str, output_path: str):
+        """Decrypt file (AES-GCM records, or a legacy Fernet token)."""
+        with open(input_path, 'rb') as src:
+            version = src.read(1)
+            if version != _AEAD_VERSION:
+                decrypted = self.cipher.decrypt(version + src.read())
+                with open(output_path, 'wb') as f:
+                    f.write(decrypted)
+                return
+            
+            try:
+                with open(output_path, 'wb') as dst:
+                    index = 0
+                    record = src.read(_AEAD_RECORD)
+                    while True:
+                        nxt = src.read(_AEAD_RECORD) if len(record) == _AEAD_RECORD else b''
+                        final = not nxt
+                        if len(record) < _NONCE_SIZE + _TAG_SIZE:
+                            raise ValueError(f"Truncated encrypted file: {input_path}")
+                        dst.write(self.aead.decrypt(
+                            record[:_NONCE_SIZE], record[_NONCE_SIZE:], _chunk_aad(index, final)
+                        ))
+                        if final:
+                            break
+                        record = nxt
+                        index += 1
+            except Exception:
+                # Don't leave partially decrypted plaintext behind
+                Path(output_path).unlink(missing_ok=True)
+                raise
     
     @staticmethod
     def hash_file(file_path: str) -> str:
         """Calculate file hash."""
-        hasher = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            while chunk := f.read(8192):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+        return sha256_file(file_path)
 
 
 class SnapshotManager:
@@ -124,11 +332,22 @@ class SnapshotManager:
         """Create encrypted snapshot of databases."""
         timestamp = datetime.utcnow()
         snapshot_dir = self.base_dir / f"snapshot_{timestamp.strftime('%Y%m%d_%H%M%S')}"
+        
+        # Most recent other snapshot; files it recorded page hashes for are
+        # stored as a delta against it
+        previous = next((m for m in self.list_snapshots()
+                         if Path(m['snapshot_dir']) != snapshot_dir), None)
+        prev_dir = Path(previous['snapshot_dir']) if previous else None
+        prev_depth = previous.get('delta_depth', {}) if previous else {}
         snapshot_dir.mkdir(exist_ok=True)
         
         file_hashes = {}
         total_size = 0
         synced_files = []
+        page_hashes = {}
+        delta_base = {}
+        delta_depth = {}
+        file_sizes = {}
         
         for db_path in db_paths:
             if not os.path.exists(db_path):
@@ -138,15 +357,28 @@ class SnapshotManager:
             file_size = os.path.getsize(db_path)
             total_size += file_size
             
-            # Create encrypted copy
             file_name = Path(db_path).name
-            encrypted_path = snapshot_dir / f"{file_name}.enc"
+            depth = prev_depth.get(file_name, 0) + 1
             
-            self.encryption.encrypt_file(db_path, str(encrypted_path))
+            base_pages = None
+            if prev_dir is not None and depth <= _MAX_DELTA_CHAIN:
+                base_pages = self._read_page_hashes(prev_dir, file_name)
             
-            # Calculate hash
-            file_hash = self.encryption.hash_file(str(encrypted_path))
-            file_hashes[file_name] = file_hash
+            if base_pages is not None:
+                # Store only the pages changed since the previous snapshot
+                delta_path = snapshot_dir / f"{file_name}.delta"
+                file_hashes[file_name], page_hashes[file_name], file_sizes[file_name] = \
+                    self.encryption.encrypt_delta(db_path, str(delta_path), base_pages)
+                delta_base[file_name] = Path(previous['snapshot_dir']).name
+                delta_depth[file_name] = depth
+            else:
+                # Create encrypted copy, hashing the ciphertext as it is written
+                encrypted_path = snapshot_dir / f"{file_name}.enc"
+                page_hashes[file_name] = []
+                file_hashes[file_name] = self.encryption.encrypt_and_hash(
+                    db_path, str(encrypted_path), page_hashes[file_name]
+                )
+            self._write_page_hashes(snapshot_dir, file_name, page_hashes[file_name])
             synced_files.append(file_name)
         
         # Create manifest
@@ -157,7 +389,11 @@ class SnapshotManager:
             db_files=synced_files,
             file_hashes=file_hashes,
             total_size_bytes=total_size,
-            encryption_enabled=True
+            encryption_enabled=True,
+            page_hashes=page_hashes,
+            delta_base=delta_base,
+            delta_depth=delta_depth,
+            file_sizes=file_sizes
         )
         
         # Save manifest
@@ -170,7 +406,10 @@ class SnapshotManager:
                 'db_files': manifest.db_files,
                 'file_hashes': manifest.file_hashes,
                 'total_size_bytes': manifest.total_size_bytes,
-                'encryption_enabled': manifest.encryption_enabled
+                'encryption_enabled': manifest.encryption_enabled,
+                'delta_base': manifest.delta_base,
+                'delta_depth': manifest.delta_depth,
+                'file_sizes': manifest.file_sizes
             }, f, indent=2)
         
         return manifest
@@ -191,21 +430,85 @@ class SnapshotManager:
         
         # Decrypt and restore files
         for file_name in manifest_data['db_files']:
-            encrypted_path = snapshot_path / f"{file_name}.enc"
             decrypted_path = output_path / file_name
+            encrypted_path = self._restore_file(snapshot_path, manifest_data, file_name, decrypted_path)
             
-            if encrypted_path.exists():
-                self.encryption.decrypt_file(str(encrypted_path), str(decrypted_path))
-                
+            if encrypted_path:
                 # Verify hash
                 expected_hash = manifest_data['file_hashes'].get(file_name)
                 actual_hash = self.encryption.hash_file(str(encrypted_path))
                 
                 if expected_hash != actual_hash:
                     print(f"Warning: Hash mismatch for {file_name}")
+                
+                # A delta chain is checked page by page after stitching
+                if file_name in manifest_data.get('delta_base', {}):
+                    expected_pages = self._read_page_hashes(snapshot_path, file_name)
+                else:
+                    expected_pages = None
+                if expected_pages is not None:
+                    pages = []
+                    with open(decrypted_path, 'rb') as f:
+                        while chunk := f.read(_AEAD_CHUNK):
+                            pages.extend(self.encryption._iter_page_hashes(chunk))
+                    if pages != expected_pages:
+                        print(f"Warning: Page hash mismatch for {file_name}")
         
         return True
     
+    def _restore_file(self, snapshot_path: Path, manifest_data: Dict[str, Any],
+                      file_name: str, decrypted_path: Path) -> Optional[Path]:
+        """
+        Decrypt one file of a snapshot, replaying its delta chain if it was
+        stored as a delta.
+        
+        Returns:
+            Path of this snapshot's encrypted file, or None if it (or any
+            snapshot in its chain) is missing
+        """
+        base_name = manifest_data.get('delta_base', {}).get(file_name)
+        if not base_name:
+            encrypted_path = snapshot_path / f"{file_name}.enc"
+            if not encrypted_path.exists():
+                return None
+            self.encryption.decrypt_file(str(encrypted_path), str(decrypted_path))
+            return encrypted_path
+        
+        delta_path = snapshot_path / f"{file_name}.delta"
+        base_path = self.base_dir / base_name
+        if not delta_path.exists() or not (base_path / "manifest.json").exists():
+            return None
+        with open(base_path / "manifest.json", 'r') as f:
+            base_manifest = json.load(f)
+        if not self._restore_file(base_path, base_manifest, file_name, decrypted_path):
+            return None
+        
+        self.encryption.apply_delta(str(delta_path), str(decrypted_path))
+        os.truncate(decrypted_path, manifest_data['file_sizes'][file_name])
+        return delta_path
+    
+    @staticmethod
+    def _write_page_hashes(snapshot_path: Path, file_name: str, page_hashes: List[str]):
+        """Write a file's page hashes to its binary <file>.pages sidecar."""
+        with open(snapshot_path / f"{file_name}.pages", 'wb') as f:
+            f.write(bytes.fromhex(''.join(page_hashes)))
+    
+    @staticmethod
+    def _read_page_hashes(snapshot_path: Path, file_name: str) -> Optional[List[str]]:
+        """
+        Page hashes recorded for a file of a snapshot.
+        
+        Returns:
+            List of hex page hashes, or None if the snapshot has no sidecar
+            for the file
+        """
+        try:
+            data = (snapshot_path / f"{file_name}.pages").read_bytes()
+        except FileNotFoundError:
+            return None
+        return [data[i:i + _PAGE_DIGEST_SIZE].hex()
+                for i in range(0, len(data), _PAGE_DIGEST_SIZE)]
+    
     def list_snapshots(self) -> List[Dict[str, Any]]:
         """List available snapshots."""
         snapshots = []
@@ -221,13 +524,23 @@ class SnapshotManager:
         return sorted(snapshots, key=lambda x: x['timestamp'], reverse=True)
     
     def cleanup_old_snapshots(self, keep_count: int = 10):
-        """Remove old snapshots."""
+        """Remove old snapshots, except those a kept delta still builds on."""
         snapshots = self.list_snapshots()
         
         if len(snapshots) > keep_count:
+            by_name = {Path(s['snapshot_dir']).name: s for s in snapshots}
+            needed = set()
+            pending = [Path(s['snapshot_dir']).name for s in snapshots[:keep_count]]
+            while pending:
+                name = pending.pop()
+                if name in needed or name not in by_name:
+                    continue
+                needed.add(name)
+                pending.extend(by_name[name].get('delta_base', {}).values())
+            
             for snapshot in snapshots[keep_count:]:
                 snapshot_dir = Path(snapshot['snapshot_dir'])
-                if snapshot_dir.exists():
+                if snapshot_dir.name not in needed and snapshot_dir.exists():
                     shutil.rmtree(snapshot_dir)
 
 
@@ -269,6 +582,11 @@ class ShadowNode:
             )
         ''')
         
+        cur.execute('''
+            CREATE INDEX IF NOT EXISTS idx_sync_history_ts
+            ON sync_history(timestamp DESC)
+        ''')
+        
         self.conn.commit()
         
         # Load existing nodes
@@ -294,12 +612,13 @@ class ShadowNode:
         """Register a shadow node."""
         self.nodes[node_info.node_id] = node_info
         
-        cur = self.conn.cursor()
-        cur.execute('''
-            INSERT OR REPLACE INTO shadow_nodes 
-            (node_id, hostname, last_sync, status, version, data_hash, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        self.conn.execute(_UPSERT_NODE_SQL, self._node_row(node_info))
+        self.conn.commit()
+    
+    @staticmethod
+    def _node_row(node_info: ShadowNodeInfo) -> tuple:
+        """Row for _UPSERT_NODE_SQL."""
+        return (
             node_info.node_id,
             node_info.hostname,
             node_info.last_sync.isoformat() if node_info.last_sync else None,
@@ -307,8 +626,7 @@ class ShadowNode:
             node_info.version,
             node_info.data_hash,
             json.dumps(node_info.metadata)
-        ))
-        self.conn.commit()
+        )
     
     def sync_to_shadows(self, db_paths: List[str]) -> Dict[str, Any]:
         """Sync data to all shadow nodes."""
@@ -318,6 +636,7 @@ class ShadowNode:
         # Update all nodes
         synced_nodes = []
         failed_nodes = []
+        node_rows = []
         
         for node_id, node_info in self.nodes.items():
             if node_id == self.node_id:
@@ -331,11 +650,14 @@ class ShadowNode:
                 node_info.status = 'healthy'
                 node_info.data_hash = manifest.file_hashes.get(db_paths[0], '') if db_paths else ''
                 
-                self.register_node(node_info)
+                node_rows.append(self._node_row(node_info))
                 synced_nodes.append(node_id)
             except Exception as e:
                 failed_nodes.append({'node_id': node_id, 'error': str(e)})
         
+        # Store all node updates; _log_sync commits them with the history row
+        self.conn.executemany(_UPSERT_NODE_SQL, node_rows)
+        
         # Log sync
         self._log_sync(manifest, synced_nodes, 'completed')
         
@@ -350,11 +672,7 @@ class ShadowNode:
     
     def _log_sync(self, manifest: SyncManifest, target_nodes: List[str], status: str):
         """Log sync operation."""
-        cur = self.conn.cursor()
-        cur.execute('''
-            INSERT INTO sync_history (timestamp, source_node, target_nodes, manifest_id, status, details)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
+        self.conn.execute(_INSERT_SYNC_SQL, (
             datetime.utcnow().isoformat(),
             manifest.source_node,
             json.dumps(target_nodes),
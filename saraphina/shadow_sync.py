@@ -5,13 +5,38 @@ ShadowSync - encrypted shadow nodes, consensus reconciliation, and recovery.
 from __future__ import annotations
 import os
 import json
-import hashlib
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from .db import write_audit_log
+from .shadow_node import sha256_file
+
+# Upper bound on concurrent per-node snapshot copies
+_PUSH_WORKERS = 32
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """Copy src to dst inside the kernel (copy_file_range), falling back
+    to shutil.copyfile (sendfile on Linux) where that isn't supported."""
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            remaining = os.fstat(src_fd).st_size
+            while remaining > 0:
+                n = os.copy_file_range(src_fd, dst_fd, remaining)
+                if n == 0:
+                    break  # Source shrank underneath us
+                remaining -= n
+    except (AttributeError, OSError):
+        # No copy_file_range (non-Linux, old kernel, cross-filesystem on
+        # some kernels); copyfile reopens and truncates dst
+        shutil.copyfile(src, dst)
 
 class ShadowManager:
     def __init__(self, conn, security_manager=None):
@@ -36,32 +61,55 @@ class ShadowManager:
         return [dict(r) for r in cur.fetchall()]
 
     def _checksum(self, file_path: str) -> str:
-        h = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            while True:
-                b = f.read(8192)
-                if not b: break
-                h.update(b)
-        return h.hexdigest()
+        st = os.stat(file_path)
+        cur = self.conn.cursor()
+        cur.execute(
+            "SELECT checksum FROM shadow_checksum_cache WHERE path=? AND mtime_ns=? AND size=?",
+            (file_path, st.st_mtime_ns, st.st_size)
+        )
+        row = cur.fetchone()
+        if row:
+            return row[0]
+        checksum = sha256_file(file_path)
+        cur.execute(
+            "INSERT OR REPLACE INTO shadow_checksum_cache (path, mtime_ns, size, checksum) VALUES (?,?,?,?)",
+            (file_path, st.st_mtime_ns, st.st_size, checksum)
+        )
+        self.conn.commit()
+        return checksum
 
     def push_snapshot(self, enc_backup_path: str, sig: Optional[str] = None) -> List[Dict]:
         """Copy an existing encrypted backup .enc (and .sig) to all active shadow nodes."""
-        results = []
-        for node in self.list():
+        fname = Path(enc_backup_path).name
+        
+        def push_one(node: Dict) -> Dict:
             try:
                 target_dir = Path(node['path'])
                 target_dir.mkdir(parents=True, exist_ok=True)
-                fname = Path(enc_backup_path).name
                 target = target_dir / fname
                 # copy file
-                data = Path(enc_backup_path).read_bytes()
-                target.write_bytes(data)
+                _copy_file(enc_backup_path, str(target))
                 # copy signature if provided
                 if sig:
                     (target_dir / (fname + '.sig')).write_text(sig, encoding='utf-8')
-                results.append({'node': node['name'], 'path': str(target), 'ok': True})
+                return {'node': node['name'], 'path': str(target), 'ok': True}
             except Exception as e:
-                results.append({'node': node['name'], 'error': str(e), 'ok': False})
+                return {'node': node['name'], 'error': str(e), 'ok': False}
+        
+        # Copies are I/O bound and independent, so nodes are written
+        # concurrently; map() keeps results in node order
+        nodes = self.list()
+        if len(nodes) > 1:
+            with ThreadPoolExecutor(max_workers=min(_PUSH_WORKERS, len(nodes))) as ex:
+                results = list(ex.map(push_one, nodes))
+        else:
+            results = [push_one(node) for node in nodes]
+        
+        # Drop checksums cached for the files just replaced
+        self.conn.executemany(
+            "DELETE FROM shadow_checksum_cache WHERE path=?",
+            [(str(Path(node['path']) / fname),) for node in nodes]
+        )
         write_audit_log(self.conn, 'shadow', 'push_snapshot', 'all', {'results': results})
         return results
 
@@ -110,9 +158,8 @@ class ShadowManager:
         if not cand:
             cand = max(inv, key=lambda x: x['ts'])
         try:
-            data = Path(cand['file']).read_bytes()
             Path(dest_db_enc_path).parent.mkdir(parents=True, exist_ok=True)
-            Path(dest_db_enc_path).write_bytes(data)
+            _copy_file(cand['file'], dest_db_enc_path)
             write_audit_log(self.conn, 'shadow', 'recover', cand['file'], {'dest': dest_db_enc_path})
             return {'ok': True, 'source': cand['file'], 'dest': dest_db_enc_path}
         except Exception as e:
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test MetricsTracker: batched metric inserts and the SQL summary behind
+get_all_statistics.
+"""
+import gc
+import random
+import sqlite3
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add saraphina to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from saraphina.self_optimizer import MetricsTracker
+
+
+@pytest.fixture()
+def db_path(tmp_path):
+    return str(tmp_path / 'metrics.db')
+
+
+def _count(db_path):
+    """Metric rows as seen by a separate connection (committed rows only)."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM optimization_metrics").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_rows_are_batched(db_path):
+    """Rows are committed once flush_every are pending, or on flush()."""
+    conn = sqlite3.connect(db_path)
+    try:
+        tracker = MetricsTracker(conn, flush_every=4)
+        for i in range(5):
+            tracker.record('latency', float(i))
+        assert _count(db_path) == 4
+        
+        tracker.flush()
+        assert _count(db_path) == 5
+    finally:
+        conn.close()
+
+
+def test_pending_rows_flushed_on_garbage_collection(db_path):
+    """Dropping the tracker writes its leftover rows through the caller's connection."""
+    conn = sqlite3.connect(db_path)
+    try:
+        tracker = MetricsTracker(conn, flush_every=100)
+        tracker.record('latency', 1.0, {'run': 1})
+        tracker.record('latency', 2.0)
+        assert _count(db_path) == 0
+        
+        del tracker
+        gc.collect()
+        assert _count(db_path) == 2
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize('window_size', [100, 20])
+def test_all_statistics_match_per_metric_statistics(db_path, window_size):
+    """get_all_statistics agrees with get_statistics, including when more
+    rows were recorded than the rolling window holds."""
+    rng = random.Random(7)
+    conn = sqlite3.connect(db_path)
+    try:
+        # Rows from before the tracker existed are not part of its windows
+        MetricsTracker(conn).record('latency', 1e6)
+        
+        tracker = MetricsTracker(conn, window_size=window_size, flush_every=8)
+        for _ in range(30):
+            tracker.record('latency', rng.uniform(0, 100))
+        for _ in range(25):
+            tracker.record('throughput', float(rng.randint(1, 50)))
+        
+        summary = tracker.get_all_statistics()
+        assert set(summary) == {'latency', 'throughput'}
+        for name, stats in summary.items():
+            expected = tracker.get_statistics(name)
+            assert stats['count'] == expected['count'] == min(window_size, 30 if name == 'latency' else 25)
+            assert stats == pytest.approx(expected)
+    finally:
+        conn.close()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test SentienceMonitor write-behind buffering: when buffered event and
+metric rows reach the database.
+"""
+import gc
+import sqlite3
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add saraphina to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from saraphina.sentience_monitor import SentienceMonitor
+
+
+@pytest.fixture()
+def db_path(tmp_path):
+    return str(tmp_path / 'sentience.db')
+
+
+@pytest.fixture()
+def monitor(db_path):
+    conn = sqlite3.connect(db_path)
+    # Large limits so nothing is flushed by size or age during a test
+    yield SentienceMonitor(conn, flush_rows=1000, flush_interval=3600.0)
+    conn.close()
+
+
+def _count(db_path, table):
+    """Row count as seen by a separate connection (committed rows only)."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_rows_are_buffered_until_flush(monitor, db_path):
+    """Untriggered events and metrics wait in memory until flush()."""
+    monitor.record_event('reflection', 'recursive_depth', 1)
+    monitor.compute_complexity('s1', {'recursive_depth': 2})
+    assert _count(db_path, 'sentience_events') == 0
+    assert _count(db_path, 'complexity_metrics') == 0
+    
+    monitor.flush()
+    assert _count(db_path, 'sentience_events') == 1
+    assert _count(db_path, 'complexity_metrics') == 1
+
+
+def test_status_and_audit_flush_before_reading(monitor, db_path):
+    """get_current_status and audit_soul see rows recorded just before them."""
+    monitor.record_event('reflection', 'self_reference_count', 2)
+    monitor.compute_complexity('s1', {'recursive_depth': 3, 'autonomy_level': 0.4})
+    
+    status = monitor.get_current_status()
+    assert status['latest_metrics']['recursive_depth'] == 3
+    assert [e['metric_name'] for e in status['recent_events']] == ['self_reference_count']
+    
+    monitor.compute_complexity('s1', {'recursive_depth': 4})
+    audit = monitor.audit_soul()
+    assert len(audit['complexity_trend']) == 2
+    assert audit['total_events'] == 1
+    assert _count(db_path, 'complexity_metrics') == 2
+
+
+def test_triggered_event_is_written_immediately(monitor, db_path):
+    """An event that crosses its threshold is committed at once, along with
+    rows buffered before it."""
+    monitor.record_event('reflection', 'recursive_depth', 1)
+    assert _count(db_path, 'sentience_events') == 0
+    
+    result = monitor.record_event('reflection', 'recursive_depth',
+                                  SentienceMonitor.THRESHOLDS['recursive_depth'])
+    assert result['triggered']
+    assert _count(db_path, 'sentience_events') == 2
+
+
+def test_batch_defers_writes_until_exit(db_path):
+    """batch() holds rows even with write-through configured."""
+    conn = sqlite3.connect(db_path)
+    try:
+        monitor = SentienceMonitor(conn, flush_rows=1)
+        with monitor.batch():
+            monitor.compute_complexity('s1', {'recursive_depth': 1})
+            monitor.compute_complexity('s1', {'recursive_depth': 2})
+            assert _count(db_path, 'complexity_metrics') == 0
+        assert _count(db_path, 'complexity_metrics') == 2
+    finally:
+        conn.close()
+
+
+def test_buffered_rows_flushed_on_garbage_collection(db_path):
+    """Dropping the monitor writes its leftover rows through the caller's connection."""
+    conn = sqlite3.connect(db_path)
+    try:
+        monitor = SentienceMonitor(conn, flush_rows=1000, flush_interval=3600.0)
+        monitor.record_event('reflection', 'recursive_depth', 1)
+        monitor.compute_complexity('s1', {'recursive_depth': 2})
+        assert _count(db_path, 'sentience_events') == 0
+        
+        del monitor
+        gc.collect()
+        assert _count(db_path, 'sentience_events') == 1
+        assert _count(db_path, 'complexity_metrics') == 1
+    finally:
+        conn.close()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test shadow node snapshots: AES-GCM encryption, delta chains, cleanup,
+and restoring legacy Fernet snapshots.
+"""
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add saraphina to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from saraphina import shadow_node
+from saraphina.shadow_node import SnapshotManager
+
+pytestmark = pytest.mark.skipif(not shadow_node.CRYPTO_AVAILABLE,
+                                reason="Requires cryptography")
+
+PAGE = shadow_node._PAGE_SIZE
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    """Advance the snapshot clock one second per snapshot, so each one gets
+    its own directory without sleeping."""
+    start = datetime(2024, 1, 1)
+    ticks = iter(range(10_000))
+    
+    class _Clock(datetime):
+        @classmethod
+        def utcnow(cls):
+            return start + timedelta(seconds=next(ticks))
+    
+    monkeypatch.setattr(shadow_node, 'datetime', _Clock)
+
+
+@pytest.fixture()
+def manager(tmp_path, clock):
+    return SnapshotManager(str(tmp_path / 'shadows'))
+
+
+def _restore(manager, snapshot_dir, out_dir, name):
+    assert manager.restore_snapshot(snapshot_dir, str(out_dir))
+    return (out_dir / name).read_bytes()
+
+
+def test_delta_chain_round_trip(manager, tmp_path, capsys):
+    """Full and delta snapshots each restore to the bytes they captured."""
+    db = tmp_path / 'memory.db'
+    # Several AES-GCM records and a partial last page
+    data = bytearray(os.urandom(2 * shadow_node._AEAD_CHUNK + 3 * PAGE + 123))
+    db.write_bytes(data)
+    versions = [bytes(data)]
+    manifests = [manager.create_snapshot([str(db)], 'n1')]
+    
+    # Touch two pages, one of them in the second record
+    data[5 * PAGE:5 * PAGE + 10] = b'x' * 10
+    data[shadow_node._AEAD_CHUNK + PAGE] ^= 0xFF
+    db.write_bytes(data)
+    versions.append(bytes(data))
+    manifests.append(manager.create_snapshot([str(db)], 'n1'))
+    
+    # Shrink, then grow past the original size
+    data = data[:PAGE * 7 + 5]
+    db.write_bytes(data)
+    versions.append(bytes(data))
+    manifests.append(manager.create_snapshot([str(db)], 'n1'))
+    data += os.urandom(PAGE * 600)
+    db.write_bytes(data)
+    versions.append(bytes(data))
+    manifests.append(manager.create_snapshot([str(db)], 'n1'))
+    
+    assert manifests[0].delta_base == {}
+    assert [m.delta_depth['memory.db'] for m in manifests[1:]] == [1, 2, 3]
+    
+    snapshots = manager.list_snapshots()[::-1]
+    delta_file = Path(snapshots[1]['snapshot_dir']) / 'memory.db.delta'
+    assert delta_file.stat().st_size < 3 * PAGE
+    for snapshot in snapshots:
+        assert 'page_hashes' not in snapshot
+        assert (Path(snapshot['snapshot_dir']) / 'memory.db.pages').exists()
+    
+    for i, (snapshot, expected) in enumerate(zip(snapshots, versions)):
+        restored = _restore(manager, snapshot['snapshot_dir'], tmp_path / f'out{i}', 'memory.db')
+        assert hashlib.sha256(restored).digest() == hashlib.sha256(expected).digest()
+    assert 'Warning' not in capsys.readouterr().out
+
+
+def test_cleanup_keeps_bases_of_kept_deltas(manager, tmp_path, monkeypatch):
+    """cleanup_old_snapshots removes old snapshots unless a kept delta builds on them."""
+    monkeypatch.setattr(shadow_node, '_MAX_DELTA_CHAIN', 1)
+    db = tmp_path / 'memory.db'
+    data = bytearray(os.urandom(PAGE * 8))
+    for i in range(4):
+        data[i * PAGE] ^= 0xFF
+        db.write_bytes(data)
+        manager.create_snapshot([str(db)], 'n1')
+    
+    # full, delta, full, delta
+    snapshots = manager.list_snapshots()[::-1]
+    names = [Path(s['snapshot_dir']).name for s in snapshots]
+    bases = [s.get('delta_base', {}).get('memory.db') for s in snapshots]
+    assert bases == [None, names[0], None, names[2]]
+    
+    manager.cleanup_old_snapshots(keep_count=1)
+    
+    remaining = sorted(Path(s['snapshot_dir']).name for s in manager.list_snapshots())
+    assert remaining == names[2:]
+    latest = manager.list_snapshots()[0]['snapshot_dir']
+    assert _restore(manager, latest, tmp_path / 'out', 'memory.db') == bytes(data)
+
+
+def test_restore_legacy_fernet_snapshot(manager, tmp_path):
+    """Snapshots written as bare Fernet tokens still restore."""
+    plaintext = os.urandom(PAGE * 3 + 17)
+    snapshot_dir = manager.base_dir / 'snapshot_20200101_000000'
+    snapshot_dir.mkdir()
+    encrypted = snapshot_dir / 'legacy.db.enc'
+    encrypted.write_bytes(manager.encryption.cipher.encrypt(plaintext))
+    with open(snapshot_dir / 'manifest.json', 'w') as f:
+        json.dump({
+            'manifest_id': 'manifest_legacy',
+            'timestamp': '2020-01-01T00:00:00',
+            'source_node': 'n1',
+            'db_files': ['legacy.db'],
+            'file_hashes': {'legacy.db': hashlib.sha256(encrypted.read_bytes()).hexdigest()},
+            'total_size_bytes': len(plaintext),
+            'encryption_enabled': True
+        }, f)
+    
+    assert _restore(manager, str(snapshot_dir), tmp_path / 'out', 'legacy.db') == plaintext